@@ -1,6 +1,7 @@
 """CAN connection interface for TP20."""
 
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -89,7 +90,7 @@ class MockCanConnection(CanConnection):
     
     def __init__(self):
         self._sent_frames = []
-        self._response_queue = []
+        self._response_queue = deque()
         self._is_open = False
     
     def open(self) -> None:
@@ -124,7 +125,7 @@ class MockCanConnection(CanConnection):
             raise _tp20_exception("CAN connection not open")
         
         if self._response_queue:
-            return self._response_queue.pop(0)
+            return self._response_queue.popleft()
         return None
     
     def queue_response(self, can_id: int, data: bytes) -> None:
@@ -174,12 +174,16 @@ class J2534Connection():
         return self.opened
 
     def rxthread_task(self):
+        # Block inside the driver until a message arrives instead of polling
+        # with a 1 ms timeout; the read returns as soon as one message is
+        # available, so this only bounds how long close() waits for the thread.
+        read_timeout_ms = 50
 
         while not self.exit_requested:
 
             try:
                 result, data, numMessages = self.interface.PassThruReadMsgs(
-                    self.channelID, self.protocol.value, 1, 1
+                    self.channelID, self.protocol.value, 1, read_timeout_ms
                 )
 
                 if data is not None:
@@ -224,8 +228,17 @@ class J2534Connection():
         return frame
 
     def empty_rxqueue(self):
-        while not self.rxqueue.empty():
-            self.rxqueue.get()
+        # Clear under the queue's own lock in one step rather than racing the
+        # rx thread with empty()/get() pairs. Discarded frames count as done,
+        # so join() does not wait on them, and blocked put()s may proceed.
+        rxqueue = self.rxqueue
+        with rxqueue.mutex:
+            discarded = len(rxqueue.queue)
+            rxqueue.queue.clear()
+            rxqueue.unfinished_tasks = max(0, rxqueue.unfinished_tasks - discarded)
+            if rxqueue.unfinished_tasks == 0:
+                rxqueue.all_tasks_done.notify_all()
+            rxqueue.not_full.notify_all()
 
     # Send and Receive Commands:
     def send(self, msg: can.Message, timeout):
@@ -16,6 +16,10 @@ except ImportError:
     )
 
 
+# Low-latency bit in the flags field of Linux's struct serial_struct
+_ASYNC_LOW_LATENCY = 0x2000
+
+
 class ComportTransport(Transport):
     """
     COM port transport for KWP2000 communication.
@@ -39,7 +43,8 @@ class ComportTransport(Transport):
             bytesize: int = serial.EIGHTBITS,
             parity: str = serial.PARITY_NONE,
             stopbits: float = serial.STOPBITS_TWO,
-            logger: Optional[logging.Logger] = None
+            logger: Optional[logging.Logger] = None,
+            low_latency: bool = False
     ):
         """
         Initialize COM port transport.
@@ -52,6 +57,8 @@ class ComportTransport(Transport):
             parity: Parity setting (default: NONE)
             stopbits: Number of stop bits (default: 1)
             logger: Optional logger instance (default: root logger)
+            low_latency: Request the driver's low-latency mode on open (see set_low_latency);
+                the previous setting is restored on close
         """
         self.port = port
         self.baudrate = baudrate
@@ -59,10 +66,13 @@ class ComportTransport(Transport):
         self.bytesize = bytesize
         self.parity = parity
         self.stopbits = stopbits
+        self.low_latency = low_latency
         self.logger = logger if logger is not None else logging.getLogger(__name__)
 
         self._serial: Optional[serial.Serial] = None
         self._is_open = False
+        # Driver low-latency state to put back on close, None if untouched
+        self._restore_low_latency: Optional[bool] = None
 
     def open(self) -> None:
         """Open the serial port connection."""
@@ -82,6 +92,10 @@ class ComportTransport(Transport):
             self.logger.info(
                 f"Opened COM port {self.port} at {self.baudrate} baud"
             )
+            if self.low_latency:
+                previous = self.get_low_latency()
+                if self.set_low_latency(True) and previous is False:
+                    self._restore_low_latency = previous
         except serial.SerialException as e:
             raise TransportException(f"Failed to open COM port {self.port}: {e}") from e
 
@@ -91,6 +105,9 @@ class ComportTransport(Transport):
             return
 
         try:
+            if self._restore_low_latency is not None:
+                restore, self._restore_low_latency = self._restore_low_latency, None
+                self.set_low_latency(restore)
             if self._serial and self._serial.is_open:
                 self._serial.close()
             self._is_open = False
@@ -121,7 +138,8 @@ class ComportTransport(Transport):
             self._serial.flush()  # Ensure data is sent immediately
             # self._serial.reset_input_buffer()
             self._serial.read(len(data))
-            self.logger.debug(f"Sent {bytes_written} bytes: {data.hex()}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Sent {bytes_written} bytes: {data.hex()}")
 
             if bytes_written != len(data):
                 raise TransportException(
@@ -163,7 +181,8 @@ class ComportTransport(Transport):
             if not data:
                 return None
 
-            self.logger.debug(f"Received {len(data)} bytes: {data.hex()}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Received {len(data)} bytes: {data.hex()}")
             return bytes(data)
 
         except serial.SerialException as e:
@@ -172,6 +191,43 @@ class ComportTransport(Transport):
             # Restore original timeout
             self._serial.timeout = original_timeout
 
+    def wait_frame_into(self, buffer, timeout: float = 1.0) -> int:
+        """
+        Wait for data from the serial port and read it into a caller-owned buffer.
+        
+        Same as wait_frame, but the data is stored in the given writable
+        buffer (e.g. a bytearray or a memoryview slice of one), so callers can
+        assemble frames in place instead of concatenating bytes objects.
+        At most len(buffer) bytes are read.
+        
+        Args:
+            buffer: Writable bytes-like object to receive the data
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            Number of bytes read, 0 if timeout occurs
+            
+        Raises:
+            TransportException: If receive fails or transport is not open
+        """
+        if not self._is_open or not self._serial or not self._serial.is_open:
+            raise TransportException("Transport not open")
+
+        original_timeout = self._serial.timeout
+        self._serial.timeout = timeout
+
+        try:
+            count = self._serial.readinto(buffer)
+
+            if count and self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Received {count} bytes: {bytes(buffer[:count]).hex()}")
+            return count or 0
+
+        except serial.SerialException as e:
+            raise TransportException(f"Serial read error: {e}") from e
+        finally:
+            self._serial.timeout = original_timeout
+
     def set_baudrate(self, baudrate: int) -> None:
         """
         Change the baudrate of the serial port connection.
@@ -196,6 +252,64 @@ class ComportTransport(Transport):
         except serial.SerialException as e:
             raise TransportException(f"Failed to change baudrate: {e}") from e
 
+    def set_low_latency(self, enabled: bool = True) -> bool:
+        """
+        Enable or disable the driver's low-latency mode (ASYNC_LOW_LATENCY).
+        
+        USB serial adapters such as FTDI otherwise hold received bytes for up
+        to their latency timer (typically 16 ms) before handing them over,
+        which dominates round trips for short request/response frames. Only
+        supported on Linux; elsewhere, or if the driver refuses, this is a
+        no-op.
+        
+        Args:
+            enabled: True to request low-latency mode, False to clear it
+            
+        Returns:
+            True if the setting was applied, False if unsupported
+            
+        Raises:
+            TransportException: If transport is not open
+        """
+        if not self._is_open or not self._serial or not self._serial.is_open:
+            raise TransportException("Transport not open")
+
+        set_low_latency_mode = getattr(self._serial, 'set_low_latency_mode', None)
+        if set_low_latency_mode is None:
+            self.logger.debug(f"Low-latency mode not supported for {self.port}")
+            return False
+
+        try:
+            set_low_latency_mode(enabled)
+        except (ValueError, OSError) as e:
+            self.logger.debug(f"Could not set low-latency mode on {self.port}: {e}")
+            return False
+
+        self.logger.debug(f"Set low-latency mode on {self.port} to {enabled}")
+        return True
+
+    def get_low_latency(self) -> Optional[bool]:
+        """
+        Read the driver's low-latency mode (ASYNC_LOW_LATENCY).
+        
+        Returns:
+            True or False, or None if the state cannot be read (not Linux,
+            transport not open, or the driver does not support it)
+        """
+        if not self._is_open or not self._serial or not self._serial.is_open:
+            return None
+        
+        try:
+            import array
+            import fcntl
+            import termios
+            buf = array.array('i', [0] * 32)
+            fcntl.ioctl(self._serial.fileno(), termios.TIOCGSERIAL, buf)
+        except (ImportError, AttributeError, ValueError, OSError, serial.SerialException):
+            return None
+        
+        return bool(buf[4] & _ASYNC_LOW_LATENCY)
+    
     @staticmethod
     def list_ports() -> list:
         """
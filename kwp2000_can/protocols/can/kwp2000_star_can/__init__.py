@@ -7,16 +7,6 @@ A Python library for KWP2000-STAR communication protocol.
 from .transport import KWP2000StarTransportCAN
 from .constants import START_BYTE, TARGET_ADDR, SRC_ADDR
 
-# Optional imports from serial module (may fail if pyserial not installed)
-try:
-    from kwp2000_can.protocols.serial.kwp2000_star_serial.frames import build_frame, parse_frame, calculate_checksum
-    _HAS_SERIAL_FRAMES = True
-except ImportError:
-    _HAS_SERIAL_FRAMES = False
-    build_frame = None
-    parse_frame = None
-    calculate_checksum = None
-
 __version__ = "0.1.0"
 
 __all__ = [
@@ -24,8 +14,24 @@ __all__ = [
     'START_BYTE',
     'TARGET_ADDR',
     'SRC_ADDR',
+    'build_frame',
+    'parse_frame',
+    'calculate_checksum',
 ]
 
-# Add frame functions to __all__ only if available
-if _HAS_SERIAL_FRAMES:
-    __all__.extend(['build_frame', 'parse_frame', 'calculate_checksum'])
+# Frame helpers re-exported from the serial module. Importing that package
+# pulls in pyserial, so they are resolved on first access instead of at
+# import time; they are None if the serial module cannot be imported.
+_SERIAL_FRAME_NAMES = ('build_frame', 'parse_frame', 'calculate_checksum')
+
+
+def __getattr__(name):
+    if name in _SERIAL_FRAME_NAMES:
+        try:
+            from kwp2000_can.protocols.serial.kwp2000_star_serial import frames
+            value = getattr(frames, name)
+        except ImportError:
+            value = None
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,7 @@
 
 import logging
 import time
+from functools import lru_cache
 from typing import Optional
 
 from kwp2000_can.protocols.kwp2000 import Transport
@@ -9,6 +10,18 @@ from kwp2000_can.protocols.kwp2000 import TransportException, TimeoutException
 from .constants import TARGET_ADDR, SRC_ADDR
 
 
+@lru_cache(maxsize=None)
+def _flow_control_frame(block_size: int, separation_time_ms: int) -> bytes:
+    """Build (once per parameter pair) a padded ISO-TP Flow Control frame."""
+    frame = bytes([TARGET_ADDR, 0x30, block_size, separation_time_ms])
+    return frame.ljust(8, b"\x00")
+
+
+# Address + PCI prefixes, indexed by Single Frame length / CF sequence number
+_SF_HEADERS = tuple(bytes((TARGET_ADDR, length)) for length in range(8))
+_CF_HEADERS = tuple(bytes((TARGET_ADDR, 0x20 | seq)) for seq in range(16))
+
+
 class KWP2000StarTransportCAN(Transport):
     """
     KWP2000-STAR transport layer that wraps a CAN connection.
@@ -65,6 +78,11 @@ class KWP2000StarTransportCAN(Transport):
         self._rx_id = rx_id
         self._tx_id = tx_id
 
+        # How open() brings up the CAN connection, detected once here:
+        # check its '_is_open' flag (like J2534CanConnection), else try open()
+        self._conn_has_open_flag = hasattr(can_connection, '_is_open')
+        self._conn_has_open = hasattr(can_connection, 'open')
+
         self._is_open = False
 
     def open(self) -> None:
@@ -73,11 +91,10 @@ class KWP2000StarTransportCAN(Transport):
             return
 
         # Open CAN connection if not already open
-        # Check if connection has an '_is_open' attribute (like J2534CanConnection)
-        if hasattr(self._can_connection, '_is_open'):
+        if self._conn_has_open_flag:
             if not self._can_connection._is_open:
                 self._can_connection.open()
-        elif hasattr(self._can_connection, 'open'):
+        elif self._conn_has_open:
             # Try to open, but don't fail if already open
             try:
                 self._can_connection.open()
@@ -124,13 +141,14 @@ class KWP2000StarTransportCAN(Transport):
 
         try:
             payload_len = len(data)
+            # Checked once per payload; .hex() formatting is skipped when off
+            debug = self.logger.isEnabledFor(logging.DEBUG)
 
             # Single frame path
             if payload_len <= 7:  # 1 byte address + 1 byte PCI + up to 6 data
-                pci = 0x00 | payload_len
-                frame = bytes([TARGET_ADDR, pci]) + data
-                frame = frame.ljust(8, b"\x00")
-                self.logger.debug(f"Sending SF: {frame.hex()}")
+                frame = (_SF_HEADERS[payload_len] + data).ljust(8, b"\x00")
+                if debug:
+                    self.logger.debug(f"Sending SF: {frame.hex()}")
                 self._can_connection.send_can_frame(self._tx_id, frame)
                 return
 
@@ -140,22 +158,24 @@ class KWP2000StarTransportCAN(Transport):
             first_pci = 0x10 | length_high
             first_frame = bytes([TARGET_ADDR, first_pci, length_low]) + data[:5]
             first_frame = first_frame.ljust(8, b"\x00")
-            self.logger.debug(f"Sending FF: {first_frame.hex()}")
+            if debug:
+                self.logger.debug(f"Sending FF: {first_frame.hex()}")
             self._can_connection.send_can_frame(self._tx_id, first_frame)
 
             # For now we always request all remaining frames (block size 0)
             # with minimal separation time (~2 ms).
             self._send_flow_control(block_size=0, separation_time_ms=2)
 
+            send_can_frame = self._can_connection.send_can_frame
+            tx_id = self._tx_id
             seq = 1
             offset = 5
             while offset < payload_len:
                 chunk = data[offset:offset + 6]
-                pci = 0x20 | (seq & 0x0F)
-                frame = bytes([TARGET_ADDR, pci]) + chunk
-                frame = frame.ljust(8, b"\x00")
-                self.logger.debug(f"Sending CF seq={seq}: {frame.hex()}")
-                self._can_connection.send_can_frame(self._tx_id, frame)
+                frame = (_CF_HEADERS[seq] + chunk).ljust(8, b"\x00")
+                if debug:
+                    self.logger.debug(f"Sending CF seq={seq}: {frame.hex()}")
+                send_can_frame(tx_id, frame)
                 offset += len(chunk)
                 seq = (seq + 1) & 0x0F
                 if seq == 0:
@@ -196,18 +216,23 @@ class KWP2000StarTransportCAN(Transport):
             total_len: Optional[int] = None
             expected_seq = 1
 
-            start_time = time.time()
-            last_activity = start_time
+            # Bind per-frame lookups once; this loop runs for every CAN frame
+            monotonic = time.monotonic
+            recv_can_frame = self._can_connection.recv_can_frame
+            rx_id = self._rx_id
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+
+            # Inactivity deadline, pushed forward whenever a frame is accepted
+            deadline = monotonic() + calculated_timeout
 
             while True:
-                now = time.time()
-                if now - last_activity >= calculated_timeout:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
                     if len(buffer) == 0:
                         return None
                     raise TimeoutException("Timeout waiting for ISO-TP frames")
 
-                remaining = calculated_timeout - (now - last_activity)
-                frame_result = self._can_connection.recv_can_frame(timeout=remaining)
+                frame_result = recv_can_frame(timeout=remaining)
 
                 if frame_result is None:
                     if len(buffer) == 0:
@@ -216,8 +241,9 @@ class KWP2000StarTransportCAN(Transport):
 
                 can_id, can_data = frame_result
 
-                if can_id != self._rx_id:
-                    self.logger.debug(f"Ignoring frame with CAN ID 0x{can_id:X} (expected 0x{self._rx_id:X})")
+                if can_id != rx_id:
+                    if debug:
+                        self.logger.debug(f"Ignoring frame with CAN ID 0x{can_id:X} (expected 0x{rx_id:X})")
                     continue
 
                 if len(can_data) == 0:
@@ -225,7 +251,8 @@ class KWP2000StarTransportCAN(Transport):
                     continue
 
                 if can_data[0] != SRC_ADDR:
-                    self.logger.debug(f"Ignoring frame with unexpected src 0x{can_data[0]:02X}")
+                    if debug:
+                        self.logger.debug(f"Ignoring frame with unexpected src 0x{can_data[0]:02X}")
                     continue
 
                 # After address, interpret PCI
@@ -240,19 +267,22 @@ class KWP2000StarTransportCAN(Transport):
                 if pci_type == 0x00:  # Single Frame
                     payload_len = pci & 0x0F
                     buffer.extend(pdu[:payload_len])
-                    self.logger.debug(f"Received SF ({payload_len} bytes): {bytes(buffer).hex()}")
+                    if debug:
+                        self.logger.debug(f"Received SF ({payload_len} bytes): {buffer.hex()}")
                     return bytes(buffer)
 
                 if pci_type == 0x10:  # First Frame
                     total_len = ((pci & 0x0F) << 8) | can_data[2]
                     first_payload = can_data[3:]
                     buffer.extend(first_payload)
-                    self.logger.debug(f"Received FF len={total_len}, first chunk {first_payload.hex()}")
+                    if debug:
+                        self.logger.debug(f"Received FF len={total_len}, first chunk {first_payload.hex()}")
                     self._send_flow_control(block_size=0, separation_time_ms=2)
                     expected_seq = 1
-                    last_activity = time.time()
+                    deadline = monotonic() + calculated_timeout
                     if len(buffer) >= total_len:
-                        return bytes(buffer[:total_len])
+                        del buffer[total_len:]
+                        return bytes(buffer)
                     continue
 
                 if pci_type == 0x20:  # Consecutive Frame
@@ -260,22 +290,25 @@ class KWP2000StarTransportCAN(Transport):
                     if seq != expected_seq:
                         raise TransportException(f"Sequence error: expected {expected_seq}, got {seq}")
                     buffer.extend(pdu)
-                    self.logger.debug(f"Received CF seq={seq}, chunk {pdu.hex()}")
+                    if debug:
+                        self.logger.debug(f"Received CF seq={seq}, chunk {pdu.hex()}")
                     expected_seq = (expected_seq + 1) & 0x0F
                     if expected_seq == 0:
                         expected_seq = 1
-                    last_activity = time.time()
+                    deadline = monotonic() + calculated_timeout
                     if total_len is not None and len(buffer) >= total_len:
-                        return bytes(buffer[:total_len])
+                        del buffer[total_len:]
+                        return bytes(buffer)
                     continue
 
                 if pci_type == 0x30:  # Flow Control from ECU (unlikely)
                     self.logger.debug("Received FC from ECU, ignoring")
-                    last_activity = time.time()
+                    deadline = monotonic() + calculated_timeout
                     continue
 
-                self.logger.debug(f"Unknown PCI type 0x{pci_type:02X}, ignoring frame")
-                last_activity = time.time()
+                if debug:
+                    self.logger.debug(f"Unknown PCI type 0x{pci_type:02X}, ignoring frame")
+                deadline = monotonic() + calculated_timeout
 
         except TimeoutException:
             raise
@@ -284,10 +317,9 @@ class KWP2000StarTransportCAN(Transport):
 
     def _send_flow_control(self, block_size: int, separation_time_ms: int) -> None:
         """Send Flow Control (FC) frame to permit ECU multi-frame responses."""
-        fc_pci = 0x30
-        frame = bytes([TARGET_ADDR, fc_pci, block_size & 0xFF, separation_time_ms & 0xFF])
-        frame = frame.ljust(8, b"\x00")
-        self.logger.debug(f"Sending FC: {frame.hex()}")
+        frame = _flow_control_frame(block_size & 0xFF, separation_time_ms & 0xFF)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Sending FC: {frame.hex()}")
         self._can_connection.send_can_frame(self._tx_id, frame)
 
     def set_timeout(self, timeout: float) -> None:
@@ -5,12 +5,26 @@ This module provides a stub implementation of the Kwp2000StarDcan class
 for serial-based CAN communication.
 """
 import logging
-from typing import Optional
+import struct
+from typing import Optional, Union
 
 import serial
 from kwp2000_can.protocols.kwp2000 import Transport
 from kwp2000_can.interface.serial.comport_transport import ComportTransport
 
+_logger = logging.getLogger(__name__)
+
+# Send frame headers: [0x80 | length, target, source] / [0x80, target, source, length]
+_PACK_HDR_SHORT = struct.Struct('BBB').pack_into
+_PACK_HDR_LONG = struct.Struct('BBBB').pack_into
+
+# Error message templates shared by the receive paths
+_MSG_SOURCE_MISMATCH = "Source address mismatch: expected tester address 0x%02X, but received 0x%02X"
+_MSG_TARGET_MISMATCH = "Target address mismatch: expected ECU address 0x%02X, but received 0x%02X"
+_MSG_LENGTH_MISMATCH = "Frame length mismatch: expected %d bytes (payload: %d), but received %d bytes"
+_MSG_CHECKSUM_MISMATCH = "Checksum mismatch: calculated 0x%02X, received 0x%02X"
+_MSG_INVALID_LENGTH_BYTE = "Invalid length byte: 0x%02X (must have 0x80 bit set)"
+
 
 class Kwp2000StarDcan(Transport):
     """
@@ -27,6 +41,12 @@ class Kwp2000StarDcan(Transport):
         source: Source address (tester address) for CAN communication
     """
 
+    __slots__ = (
+        'port', 'baudrate', 'timeout', 'target', 'source', 'zero_copy',
+        '_rx_buf', '_tx_buf', '_builders', '_parsers',
+        '_is_open', 'logger', '_comport_transport',
+    )
+
     def __init__(
             self,
             port: str,
@@ -36,7 +56,8 @@ class Kwp2000StarDcan(Transport):
             source: int = 0xF1,
             bytesize: int = serial.EIGHTBITS,
             parity: str = serial.PARITY_NONE,
-            stopbits: float = serial.STOPBITS_TWO
+            stopbits: float = serial.STOPBITS_TWO,
+            zero_copy: bool = False
     ):
         """
         Initialize the KWP2000-STAR DCAN adapter.
@@ -50,14 +71,28 @@ class Kwp2000StarDcan(Transport):
             bytesize: Number of data bits (default: 8)
             parity: Parity setting (default: NONE)
             stopbits: Number of stop bits (default: 2)
+            zero_copy: If True, wait_frame returns the payload as a memoryview into
+                the receive buffer instead of copying it into a new bytes object;
+                the view is only valid until the next wait_frame call. Responses
+                parsed by KWP2000Client (Response.from_payload) still copy it once,
+                so their data is not affected by later receives
         """
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
         self.target = target
         self.source = source
+        self.zero_copy = zero_copy
+        # Receive buffer, large enough for a long-format frame
+        # (0x80 + source + target + length + 255 payload bytes + checksum)
+        self._rx_buf = bytearray(260)
+        # Transmit buffer, reused by send() for the same maximum frame size
+        self._tx_buf = bytearray(260)
+        # Frame format handlers, indexed by "is long format"
+        self._builders = (self._build_send_frame_short, self._build_send_frame_long)
+        self._parsers = (self._parse_receive_frame_short, self._parse_receive_frame_long)
         self._is_open = False
-        self.logger = logging.getLogger(__name__)
+        self.logger = _logger
 
         self._comport_transport = ComportTransport(
             port=port,
@@ -94,9 +129,9 @@ class Kwp2000StarDcan(Transport):
         # Stub implementation
         self._is_open = False
 
-    def _build_send_frame_short(self, data: bytes) -> bytearray:
+    def _build_send_frame_short(self, data: bytes) -> int:
         """
-        Build a short format send frame (for payload length <= 0x3F).
+        Build a short format send frame (for payload length <= 0x3F) in the TX buffer.
         
         Frame structure: [0x80 | length, ECU address, Tester address, payload..., checksum]
         
@@ -104,16 +139,17 @@ class Kwp2000StarDcan(Transport):
             data: Payload data to send (bytes)
             
         Returns:
-            Complete frame as bytearray (without checksum, checksum will be added separately)
+            Number of frame bytes written (without checksum, checksum will be added separately)
         """
         send_data_length = len(data)
-        telegram = bytearray([0x80 | send_data_length, self.target, self.source])
-        telegram.extend(data)
-        return telegram
+        telegram = self._tx_buf
+        _PACK_HDR_SHORT(telegram, 0, 0x80 | send_data_length, self.target, self.source)
+        telegram[3:3 + send_data_length] = data
+        return 3 + send_data_length
     
-    def _build_send_frame_long(self, data: bytes) -> bytearray:
+    def _build_send_frame_long(self, data: bytes) -> int:
         """
-        Build a long format send frame (for payload length > 0x3F).
+        Build a long format send frame (for payload length > 0x3F) in the TX buffer.
         
         Frame structure: [0x80, ECU address, Tester address, length, payload..., checksum]
         
@@ -121,14 +157,20 @@ class Kwp2000StarDcan(Transport):
             data: Payload data to send (bytes)
             
         Returns:
-            Complete frame as bytearray (without checksum, checksum will be added separately)
+            Number of frame bytes written (without checksum, checksum will be added separately)
+            
+        Raises:
+            ValueError: If payload is longer than 255 bytes
         """
         send_data_length = len(data)
-        telegram = bytearray([0x80, self.target, self.source, send_data_length])
-        telegram.extend(data)
-        return telegram
+        if send_data_length > 0xFF:
+            raise ValueError(f"Payload too long: {send_data_length} bytes, maximum 255 bytes")
+        telegram = self._tx_buf
+        _PACK_HDR_LONG(telegram, 0, 0x80, self.target, self.source, send_data_length)
+        telegram[4:4 + send_data_length] = data
+        return 4 + send_data_length
 
-    def send(self, data: bytes) -> None:
+    def send(self, data: Union[bytes, bytearray, memoryview]) -> None:
         """
         Send a KWP2000 telegram with checksum.
         
@@ -137,32 +179,35 @@ class Kwp2000StarDcan(Transport):
         Long format: [0x80, target (ECU), source (tester), length, payload..., checksum]
 
         Args:
-            data: Payload data to send (bytes)
+            data: Payload data to send (any bytes-like object)
             
         Raises:
+            TypeError: If data does not support the buffer protocol
             ValueError: If payload is too large or connection is not open
             RuntimeError: If connection is not open
         """
         if not self._is_open:
             raise RuntimeError("Connection is not open. Call open() first.")
         
-        if not isinstance(data, bytes):
-            raise TypeError(f"Expected bytes, got {type(data).__name__}")
+        # Accept any bytes-like object (bytes, bytearray, memoryview, ...) without copying
+        try:
+            data = memoryview(data).cast('B')
+        except TypeError as e:
+            raise TypeError(f"Expected bytes-like object, got {type(data).__name__}") from e
         
         send_data_length = len(data)
         
-        # Build telegram using appropriate format
-        if send_data_length > 0x3F:
-            telegram = self._build_send_frame_long(data)
-        else:
-            telegram = self._build_send_frame_short(data)
+        # Build telegram in the TX buffer using appropriate format
+        frame_len = self._builders[send_data_length > 0x3F](data)
         
-        # Calculate checksum (covers entire frame except checksum byte)
-        checksum = self._calculate_checksum(telegram)
-        telegram.append(checksum)
+        # Checksum covers entire frame except checksum byte; the header bytes
+        # are known values (0x80 | length, or 0x80 + length byte, plus the
+        # current target/source addresses), so only the payload needs summing
+        checksum = (0x80 + send_data_length + self.target + self.source + sum(data)) & 0xFF
+        self._tx_buf[frame_len] = checksum
         
         try:
-            self._comport_transport.send(telegram)
+            self._comport_transport.send(memoryview(self._tx_buf)[:frame_len + 1])
         except Exception as e:
             raise RuntimeError(f"Failed to send telegram: {e}") from e
 
@@ -173,7 +218,7 @@ class Kwp2000StarDcan(Transport):
         Frame structure: [0x80 | length, source (tester), target (ECU), payload..., checksum]
         
         Args:
-            data: Complete frame bytes including header and checksum
+            data: Complete frame (bytes-like) including header and checksum
             
         Returns:
             Payload bytes (without header and checksum)
@@ -188,45 +233,9 @@ class Kwp2000StarDcan(Transport):
         # Extract and validate length byte
         length_byte = data[0]
         if (length_byte & 0x80) == 0:
-            raise ValueError(f"Invalid length byte: 0x{length_byte:02X} (must have 0x80 bit set)")
-        
-        expected_payload_len = length_byte & 0x7F
-        expected_frame_len = 4 + expected_payload_len  # length + source + target + payload + checksum
-        
-        if len(data) != expected_frame_len:
-            raise ValueError(
-                f"Frame length mismatch: expected {expected_frame_len} bytes "
-                f"(payload: {expected_payload_len}), but received {len(data)} bytes"
-            )
-        
-        # Validate addresses (incoming frame: [length, source(tester), target(ECU), ...])
-        # data[1] is the source (tester address) - should match self.source
-        if data[1] != self.source:
-            raise ValueError(
-                f"Source address mismatch: expected tester address 0x{self.source:02X}, "
-                f"but received 0x{data[1]:02X}"
-            )
-        
-        # data[2] is the target (ECU address) - should match self.target
-        if data[2] != self.target:
-            raise ValueError(
-                f"Target address mismatch: expected ECU address 0x{self.target:02X}, "
-                f"but received 0x{data[2]:02X}"
-            )
+            raise ValueError(_MSG_INVALID_LENGTH_BYTE % length_byte)
         
-        # Extract payload (excluding header and checksum)
-        payload = data[3:-1]
-        received_checksum = data[-1]
-        
-        # Calculate and validate checksum (checksum covers entire frame except checksum byte)
-        calculated_checksum = self._calculate_checksum(data[:-1])
-        if received_checksum != calculated_checksum:
-            raise ValueError(
-                f"Checksum mismatch: calculated 0x{calculated_checksum:02X}, "
-                f"received 0x{received_checksum:02X}"
-            )
-        
-        return payload
+        return self._parse_receive_frame_common(data, 3, length_byte & 0x7F)
     
     def _parse_receive_frame_long(self, data: bytes) -> bytes:
         """
@@ -235,7 +244,7 @@ class Kwp2000StarDcan(Transport):
         Frame structure: [0x80, source (tester), target (ECU), length, payload..., checksum]
         
         Args:
-            data: Complete frame bytes including header and checksum
+            data: Complete frame (bytes-like) including header and checksum
             
         Returns:
             Payload bytes (without header and checksum)
@@ -251,46 +260,51 @@ class Kwp2000StarDcan(Transport):
         if data[0] != 0x80:
             raise ValueError(f"Invalid first byte: expected 0x80, but received 0x{data[0]:02X}")
         
-        # Validate addresses (incoming frame: [0x80, source(tester), target(ECU), length, ...])
-        # data[1] is the source (tester address) - should match self.source
-        if data[1] != self.source:
-            raise ValueError(
-                f"Source address mismatch: expected tester address 0x{self.source:02X}, "
-                f"but received 0x{data[1]:02X}"
-            )
+        return self._parse_receive_frame_common(data, 4, data[3])
+
+    def _parse_receive_frame_common(self, data: bytes, payload_offset: int, payload_len: int) -> Union[bytes, memoryview]:
+        """
+        Validate and extract the payload of a receive frame of either format.
         
-        # data[2] is the target (ECU address) - should match self.target
-        if data[2] != self.target:
-            raise ValueError(
-                f"Target address mismatch: expected ECU address 0x{self.target:02X}, "
-                f"but received 0x{data[2]:02X}"
-            )
+        Both formats share the address bytes at data[1] (source, tester) and
+        data[2] (target, ECU) and end with the checksum byte; they differ only
+        in where the payload starts.
         
-        # Extract payload length from byte 3
-        expected_payload_len = data[3]
-        expected_frame_len = 5 + expected_payload_len  # 0x80 + source + target + length + payload + checksum
+        Args:
+            data: Complete frame (bytes-like) including header and checksum
+            payload_offset: Index of the first payload byte (3 short, 4 long)
+            payload_len: Payload length announced in the header
+            
+        Returns:
+            Payload bytes (without header and checksum), or a memoryview slice of
+            data if zero_copy is set
+            
+        Raises:
+            ValueError: If frame length, addresses or checksum don't match
+        """
+        expected_frame_len = payload_offset + payload_len + 1  # header + payload + checksum
         
         if len(data) != expected_frame_len:
-            raise ValueError(
-                f"Frame length mismatch: expected {expected_frame_len} bytes "
-                f"(payload: {expected_payload_len}), but received {len(data)} bytes"
-            )
+            raise ValueError(_MSG_LENGTH_MISMATCH % (expected_frame_len, payload_len, len(data)))
         
-        # Extract payload (excluding header and checksum)
-        payload = data[4:-1]
-        received_checksum = data[-1]
+        if data[1] != self.source:
+            raise ValueError(_MSG_SOURCE_MISMATCH % (self.source, data[1]))
+        
+        if data[2] != self.target:
+            raise ValueError(_MSG_TARGET_MISMATCH % (self.target, data[2]))
         
-        # Calculate and validate checksum (checksum covers entire frame except checksum byte)
-        calculated_checksum = self._calculate_checksum(data[:-1])
+        # Calculate and validate checksum (checksum covers entire frame except checksum byte);
+        # sum the whole frame in one pass and take the checksum byte back out
+        received_checksum = data[-1]
+        calculated_checksum = (self._calculate_checksum(data) - received_checksum) & 0xFF
         if received_checksum != calculated_checksum:
-            raise ValueError(
-                f"Checksum mismatch: calculated 0x{calculated_checksum:02X}, "
-                f"received 0x{received_checksum:02X}"
-            )
+            raise ValueError(_MSG_CHECKSUM_MISMATCH % (calculated_checksum, received_checksum))
         
-        return payload
+        if self.zero_copy:
+            return data[payload_offset:-1]
+        return bytes(data[payload_offset:-1])
 
-    def wait_frame(self, timeout: float = 1.0) -> Optional[bytes]:
+    def wait_frame(self, timeout: float = 1.0) -> Optional[Union[bytes, memoryview]]:
         """
         Wait for and receive a KWP2000 telegram frame.
         
@@ -302,7 +316,8 @@ class Kwp2000StarDcan(Transport):
             timeout: Timeout in seconds for receiving the frame
             
         Returns:
-            Payload bytes (without header and checksum), or None if timeout
+            Payload bytes (without header and checksum), or None if timeout;
+            a memoryview into the receive buffer if zero_copy is set
             
         Raises:
             ValueError: If frame structure is invalid, addresses don't match, or checksum is incorrect
@@ -312,69 +327,61 @@ class Kwp2000StarDcan(Transport):
             raise RuntimeError("Connection is not open. Call open() first.")
         
         try:
+            # Frames are read straight into the per-instance receive buffer
+            comport_transport = self._comport_transport
+            buffer = self._rx_buf
+            view = memoryview(buffer)
+            
             # Step 1: Receive first 3 bytes using ComportTransport
-            header = self._comport_transport.wait_frame(timeout=timeout, max_bytes=3)
+            received = comport_transport.wait_frame_into(view[:3], timeout=timeout)
             
-            if header is None or len(header) != 3:
-                raise TimeoutError(f"No frame received within {timeout} seconds (only got {len(header) if header else 0} bytes)")
+            if received != 3:
+                raise TimeoutError(f"No frame received within {timeout} seconds (only got {received} bytes)")
             
             # Step 2: Validate first 3 bytes
-            first_byte = header[0]
-            source_byte = header[1]
-            target_byte = header[2]
+            first_byte = buffer[0]
+            source_byte = buffer[1]
+            target_byte = buffer[2]
             
             # Validate addresses
             if source_byte != self.source:
-                raise ValueError(
-                    f"Source address mismatch: expected tester address 0x{self.source:02X}, "
-                    f"but received 0x{source_byte:02X}"
-                )
+                raise ValueError(_MSG_SOURCE_MISMATCH % (self.source, source_byte))
             
             if target_byte != self.target:
-                raise ValueError(
-                    f"Target address mismatch: expected ECU address 0x{self.target:02X}, "
-                    f"but received 0x{target_byte:02X}"
-                )
+                raise ValueError(_MSG_TARGET_MISMATCH % (self.target, target_byte))
             
             # Step 3: Determine frame format and calculate remaining bytes to read
             if first_byte == 0x80:
                 # Long format: [0x80, source, target, length, payload..., checksum]
                 # Need to read length byte first
-                length_byte_data = self._comport_transport.wait_frame(timeout=timeout, max_bytes=1)
-                if length_byte_data is None or len(length_byte_data) != 1:
+                if comport_transport.wait_frame_into(view[3:4], timeout=timeout) != 1:
                     raise TimeoutError(f"Timeout reading length byte")
                 
-                expected_payload_len = length_byte_data[0]
-                # Remaining bytes: payload + checksum = payload_len + 1
-                remaining_bytes = expected_payload_len + 1
+                expected_payload_len = buffer[3]
+                header_len = 4
             else:
                 # Short format: [0x80 | length, source, target, payload..., checksum]
                 if (first_byte & 0x80) == 0:
-                    raise ValueError(f"Invalid length byte: 0x{first_byte:02X} (must have 0x80 bit set)")
+                    raise ValueError(_MSG_INVALID_LENGTH_BYTE % first_byte)
                 
                 expected_payload_len = first_byte & 0x7F
-                # Remaining bytes: payload + checksum = payload_len + 1
-                remaining_bytes = expected_payload_len + 1
-                length_byte_data = None  # Not needed for short format
+                header_len = 3
+            
+            # Remaining bytes: payload + checksum = payload_len + 1
+            remaining_bytes = expected_payload_len + 1
+            frame_len = header_len + remaining_bytes
             
             # Step 4: Receive the rest based on calculated length
-            remaining_data = self._comport_transport.wait_frame(timeout=timeout, max_bytes=remaining_bytes)
+            received = comport_transport.wait_frame_into(view[header_len:frame_len], timeout=timeout)
             
-            if remaining_data is None or len(remaining_data) != remaining_bytes:
+            if received != remaining_bytes:
                 raise TimeoutError(
                     f"Timeout reading remaining data: expected {remaining_bytes} bytes, "
-                    f"but received {len(remaining_data) if remaining_data else 0} bytes"
+                    f"but received {received} bytes"
                 )
             
-            # Step 5: Combine header and remaining data, then pass to parsing methods
-            if first_byte == 0x80:
-                # Long format: combine [0x80, source, target] + [length] + remaining_data
-                data = header + length_byte_data + remaining_data
-                return self._parse_receive_frame_long(data)
-            else:
-                # Short format: combine [0x80 | length, source, target] + remaining_data
-                data = header + remaining_data
-                return self._parse_receive_frame_short(data)
+            # Step 5: Pass the assembled frame to the parsing method for the frame format
+            return self._parsers[first_byte == 0x80](view[:frame_len])
                 
         except TimeoutError:
             raise
@@ -388,7 +395,7 @@ class Kwp2000StarDcan(Transport):
         Calculate 8-bit checksum (sum of all bytes, modulo 256).
         
         Args:
-            data: Bytes to calculate checksum for
+            data: Bytes-like object (bytes, bytearray or memoryview) to calculate checksum for
             
         Returns:
             Checksum value (0-255)
@@ -3,6 +3,7 @@
 import queue
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Optional
@@ -139,7 +140,8 @@ class TP20Transport(Transport):
         # Threading primitives
         self._cmd_queue: queue.Queue[_Command] = queue.Queue()
         self._response_queue: queue.Queue[_Response] = queue.Queue()
-        self._rx_queue: queue.Queue = queue.Queue()
+        # Frames polled ahead of use; only touched by the worker thread
+        self._rx_queue: deque = deque()
         self._stop_event = threading.Event()
         self._keepalive_stop_event = threading.Event()
         self._keepalive_thread: Optional[threading.Thread] = None
@@ -256,15 +258,14 @@ class TP20Transport(Transport):
     def _keepalive_loop(self) -> None:
         """Periodically send channel test (A3) frames while the channel is active."""
         interval = self.keepalive_interval_ms / 1000.0
+        channel_test = build_channel_test()
         while not self._keepalive_stop_event.wait(interval):
             if not self._is_open or not self._channel_setup:
                 continue
             if self._tx_can_id is None:
                 continue
             try:
-                self.can_connection.send_can_frame(
-                    self._tx_can_id, build_channel_test()
-                )
+                self.can_connection.send_can_frame(self._tx_can_id, channel_test)
             except Exception:
                 # Ignore keep-alive send errors to avoid stopping the loop
                 continue
@@ -292,7 +293,7 @@ class TP20Transport(Transport):
                 except Exception:
                     frame = None
                 if frame is not None:
-                    self._rx_queue.put(frame)
+                    self._rx_queue.append(frame)
 
             try:
                 cmd = self._cmd_queue.get(timeout=0.05)
@@ -380,23 +381,27 @@ class TP20Transport(Transport):
         if not self._channel_setup:
             raise TP20DisconnectedException("Channel not set up")
 
-        start_time = time.time()
+        # Bind per-frame lookups once; this loop runs for every CAN frame
+        monotonic = time.monotonic
+        next_frame = self._next_frame
+        rx_can_id = self._rx_can_id
+
+        deadline = monotonic() + timeout
         self._receive_buffer.clear()
         self._receive_length = None
         self._receive_sequence = None
 
         while True:
-            elapsed = time.time() - start_time
-            if elapsed >= timeout:
+            remaining_timeout = deadline - monotonic()
+            if remaining_timeout <= 0:
                 raise TP20TimeoutException("Timeout waiting for frame")
 
-            remaining_timeout = timeout - elapsed
-            frame = self._next_frame(timeout=remaining_timeout)
+            frame = next_frame(timeout=remaining_timeout)
             if frame is None:
                 continue
 
             can_id, data = frame
-            if can_id != self._rx_can_id:
+            if can_id != rx_can_id:
                 continue
 
             if len(data) == 1 and data[0] == OPCODE_CHANNEL_TEST:
@@ -447,9 +452,9 @@ class TP20Transport(Transport):
                     self._receive_length is not None
                     and len(self._receive_buffer) >= self._receive_length
                 ):
-                    received_data = bytes(
-                        self._receive_buffer[: self._receive_length]
-                    )
+                    # Trim the padding in place so the payload is copied once
+                    del self._receive_buffer[self._receive_length:]
+                    received_data = bytes(self._receive_buffer)
                     self._receive_buffer.clear()
                     self._receive_length = None
                     self._receive_sequence = None
@@ -462,10 +467,8 @@ class TP20Transport(Transport):
 
     def _next_frame(self, timeout: float) -> Optional[tuple]:
         """Get next CAN frame, preferring any already queued frames."""
-        try:
-            return self._rx_queue.get_nowait()
-        except queue.Empty:
-            pass
+        if self._rx_queue:
+            return self._rx_queue.popleft()
         return self.can_connection.recv_can_frame(timeout=timeout)
 
     def _format_frame(self, can_id: int, data: bytes) -> str:
@@ -519,19 +522,10 @@ class TP20Transport(Transport):
         self._receive_length = None
         self._receive_sequence = None
         self._send_sequence = 0
-        self._clear_queue(self._rx_queue)
+        self._rx_queue.clear()
         self._keepalive_stop_event.set()
         self._keepalive_thread = None
 
-    @staticmethod
-    def _clear_queue(target_queue: queue.Queue) -> None:
-        """Drain all items from a queue without blocking."""
-        try:
-            while True:
-                target_queue.get_nowait()
-        except queue.Empty:
-            return
-    
     def _setup_channel(self) -> None:
         """Setup TP20 channel."""
         # Build setup request
@@ -550,9 +544,9 @@ class TP20Transport(Transport):
         
         # Wait for response
         response_can_id = CAN_ID_SETUP_RESPONSE_BASE + self.dest
-        start_time = time.time()
+        deadline = time.monotonic() + self.timeout
         
-        while time.time() - start_time < self.timeout:
+        while time.monotonic() < deadline:
             frame = self._next_frame(timeout=0.1)
             if frame is None:
                 continue
@@ -602,9 +596,9 @@ class TP20Transport(Transport):
         self.can_connection.send_can_frame(self._tx_can_id, params_req)
         
         # Wait for response
-        start_time = time.time()
+        deadline = time.monotonic() + self.timeout
         
-        while time.time() - start_time < self.timeout:
+        while time.monotonic() < deadline:
             frame = self._next_frame(timeout=0.1)
             if frame is None:
                 continue
@@ -679,10 +673,10 @@ class TP20Transport(Transport):
     
     def _wait_for_ack(self, sequence: int) -> None:
         """Wait for ACK for given sequence number."""
-        start_time = time.time()
+        deadline = time.monotonic() + self.timeout
         frames_received = []
         
-        while time.time() - start_time < self.timeout:
+        while time.monotonic() < deadline:
             frame = self._next_frame(timeout=0.1)
             if frame is None:
                 continue
@@ -742,8 +736,8 @@ class TP20Transport(Transport):
         self.can_connection.send_can_frame(self._tx_can_id, disconnect_frame)
         
         # Wait for disconnect response (optional, but good practice)
-        start_time = time.time()
-        while time.time() - start_time < 0.5:  # Shorter timeout for disconnect
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline:  # Shorter timeout for disconnect
             frame = self._next_frame(timeout=0.1)
             if frame is None:
                 continue
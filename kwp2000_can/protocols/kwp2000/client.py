@@ -1002,7 +1002,7 @@ class KWP2000Client:
         self,
         esc_code_data: Optional[bytes] = None,
         timeout: float = 1.0
-    ) -> dict:
+    ) -> services.EscCode.ServiceData:
         """
         ESC code (KWP2000 specific, not part of standard diagnostic services).
         
@@ -1011,7 +1011,7 @@ class KWP2000Client:
             timeout: Timeout in seconds
             
         Returns:
-            Dictionary with parsed response data
+            ServiceData with parsed response data
         """
         request = services.EscCode.make_request(esc_code_data=esc_code_data)
         response = self.send_request(request, timeout=timeout)
@@ -254,7 +254,8 @@ def baudrate_identifier_to_value(identifier: int) -> int:
     Raises:
         ValueError: If identifier is not recognized
     """
-    if identifier not in BAUDRATE_IDENTIFIER_TO_VALUE:
+    value = BAUDRATE_IDENTIFIER_TO_VALUE.get(identifier)
+    if value is None:
         raise ValueError(f"Unknown baudrate identifier: 0x{identifier:02X}")
-    return BAUDRATE_IDENTIFIER_TO_VALUE[identifier]
+    return value
 
@@ -4,14 +4,20 @@ from typing import Optional, Tuple
 
 from .constants import (
     ADDRESS_MODE_NO_ADDRESS,
-    ADDRESS_MODE_EXCEPTION,
     ADDRESS_MODE_PHYSICAL,
-    ADDRESS_MODE_FUNCTIONAL,
     LENGTH_MASK,
     ADDRESS_MODE_MASK,
 )
 
 
+# Header length (format byte + address bytes) indexed by address mode;
+# exception (CARB) mode carries address bytes that are not reported
+_HEADER_LENGTHS = (1, 3, 3, 3)
+
+# Whether target/source addresses are reported, indexed by address mode
+_HAS_ADDRESSES = (False, False, True, True)
+
+
 def parse_format_byte(fmt_byte: int) -> Tuple[int, int]:
     """
     Parse format byte into address mode and length.
@@ -74,6 +80,12 @@ def build_frame(
     # Calculate data length (service ID + data bytes)
     data_length = 1 + len(data)  # Service ID + data
     
+    # Fast path for the common short addressed frame: one bytes() call for
+    # header + service ID, no intermediate bytearray
+    if address_mode == ADDRESS_MODE_PHYSICAL and not use_extended_length and data_length < 64:
+        fmt_byte = build_format_byte(address_mode, data_length)
+        return bytes((fmt_byte, target_address, source_address, service_id)) + data
+    
     # Build header
     header = bytearray()
     
@@ -122,16 +134,11 @@ def parse_frame(frame: bytes) -> Tuple[int, bytes, Optional[int], Optional[int]]
     
     # Parse format byte
     fmt_byte = frame[0]
-    address_mode, length = parse_format_byte(fmt_byte)
-    
-    # Determine header length
-    header_start = 1
-    if address_mode == ADDRESS_MODE_PHYSICAL or address_mode == ADDRESS_MODE_FUNCTIONAL:
-        header_start = 3  # Format + Target + Source
-    elif address_mode == ADDRESS_MODE_EXCEPTION:
-        header_start = 3  # Format + Target + Source (CARB mode)
-    else:
-        header_start = 1  # Format only
+    address_mode = (fmt_byte & ADDRESS_MODE_MASK) >> 6
+    length = fmt_byte & LENGTH_MASK
+    
+    # Header length and address presence come straight from the tables
+    header_start = _HEADER_LENGTHS[address_mode]
     
     # Check if extended length byte is used
     if length == 0:
@@ -145,7 +152,7 @@ def parse_frame(frame: bytes) -> Tuple[int, bytes, Optional[int], Optional[int]]
     # Extract addresses
     target_address = None
     source_address = None
-    if address_mode == ADDRESS_MODE_PHYSICAL or address_mode == ADDRESS_MODE_FUNCTIONAL:
+    if _HAS_ADDRESSES[address_mode]:
         if len(frame) < 3:
             raise ValueError("Frame too short for address bytes")
         target_address = frame[1]
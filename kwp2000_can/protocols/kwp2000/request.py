@@ -27,6 +27,24 @@ class Request:
         self.service_id = service_id
         self.data = bytes(data)
     
+    def reset(self, service_id: int, data: bytes = b'') -> 'Request':
+        """
+        Reuse this request for a new service ID and data.
+        
+        Lets polling loops keep one Request object instead of allocating
+        a new one per cycle.
+        
+        Args:
+            service_id: Service ID byte
+            data: Data bytes (after service ID)
+            
+        Returns:
+            This request
+        """
+        self.service_id = service_id
+        self.data = bytes(data)
+        return self
+    
     def get_payload(self) -> bytes:
         """
         Get the complete frame payload (including header).
@@ -42,7 +42,7 @@ class Response:
             source_address: Optional source address
         """
         self.service = service
-        self.code = code
+        self.code = code  # also sets self.positive
         self.data = data
         self.target_address = target_address
         self.source_address = source_address
@@ -52,8 +52,12 @@ class Response:
         """
         Parse a response from frame payload.
         
+        A payload that is not a bytes object (e.g. a memoryview into a
+        transport's receive buffer) is copied once here, so the response data
+        stays valid after the transport reuses its buffer.
+        
         Args:
-            payload: Complete frame bytes
+            payload: Complete frame bytes (any bytes-like object)
             
         Returns:
             Response object
@@ -65,6 +69,9 @@ class Response:
         if payload is None or len(payload) < 1:
             raise InvalidFrameException("Invalid payload")
         
+        if not isinstance(payload, bytes):
+            payload = bytes(payload)
+        
         # Check if this is raw service data (from TP20) or a full KWP2000 frame
         # Format bytes are typically 0x00-0x3F (address mode + length)
         # Service IDs are typically 0x10-0x3F (requests) or 0x40-0x7F (positive responses) or 0x7F (negative)
@@ -117,9 +124,21 @@ class Response:
                 source_address=source_addr
             )
     
+    @property
+    def code(self) -> str:
+        """Response code (Response.Code.PositiveResponse or NegativeResponse)."""
+        return self._code
+    
+    @code.setter
+    def code(self, value: str) -> None:
+        # positive is a plain attribute so parsers read it without a call;
+        # keep it in step with code whenever code is assigned.
+        self._code = value
+        self.positive = value == self.Code.PositiveResponse
+    
     def is_positive(self) -> bool:
         """Check if response is positive."""
-        return self.code == self.Code.PositiveResponse
+        return self.positive
     
     def is_negative(self) -> bool:
         """Check if response is negative."""
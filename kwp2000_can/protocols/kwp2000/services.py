@@ -1,7 +1,8 @@
 """Service definitions for KWP2000."""
 
-from dataclasses import dataclass
-from typing import Optional
+import struct
+from dataclasses import dataclass, fields
+from typing import Iterator, NamedTuple, Optional, Union
 
 from .request import Request
 from .response import Response
@@ -48,6 +49,105 @@ from .constants import (
     TimingParameters,
 )
 
+# Pre-built single-byte payloads, indexed by byte value
+_ONEBYTE = tuple(bytes((i,)) for i in range(256))
+
+
+def _u8(value: int) -> bytes:
+    """
+    Return the single-byte payload for value.
+    
+    Raises ValueError if value is outside 0..255, like bytes([value]).
+    """
+    if 0 <= value <= 0xFF:
+        return _ONEBYTE[value]
+    raise ValueError(f"byte must be in range(0, 256), got {value}")
+
+# 24-bit memory address followed by a 24-bit memory size
+_ADDR24_SIZE24 = struct.Struct('>BHBH')
+
+# 24-bit memory address and size followed by one method byte
+_ADDR24_SIZE24_METHOD = struct.Struct('>BHBHB')
+
+# 24-bit memory address and size followed by compression and encryption bytes
+_ADDR24_SIZE24_METHODS = struct.Struct('>BHBHBB')
+
+# Big-endian 16-bit value (DTC codes, common identifiers)
+_U16 = struct.Struct('>H')
+
+# 2-byte DTC code followed by its status byte
+_DTC_TRIPLET = struct.Struct('>HB')
+
+
+def _pack_u24(value: int) -> bytes:
+    """
+    Pack a 24-bit value (e.g. a memory address) as 3 big-endian bytes.
+    
+    Raises OverflowError if value is negative or does not fit in 24 bits.
+    """
+    return value.to_bytes(3, 'big')
+
+
+def _check_u24(value: int) -> int:
+    """
+    Return value unchanged if it fits in 24 bits.
+    
+    Raises OverflowError otherwise, like _pack_u24.
+    """
+    if 0 <= value <= 0xFFFFFF:
+        return value
+    raise OverflowError(f"value must be in range(0, 0x1000000), got {value}")
+
+
+def _check_u8(value: int) -> int:
+    """
+    Return value unchanged if it fits in one byte.
+    
+    Raises ValueError otherwise, like _u8.
+    """
+    if 0 <= value <= 0xFF:
+        return value
+    raise ValueError(f"byte must be in range(0, 256), got {value}")
+
+
+def _unpack_u24(data: bytes, offset: int = 0) -> int:
+    """Unpack 3 big-endian bytes at offset into a 24-bit value."""
+    return int.from_bytes(data[offset:offset + 3], 'big')
+
+
+def _dataclass_getstate(self):
+    """Slot values in field order, for copy and pickle."""
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _dataclass_setstate(self, state):
+    """Restore slot values; bypasses __setattr__ so frozen classes work too."""
+    for field, value in zip(fields(self), state):
+        object.__setattr__(self, field.name, value)
+
+
+def _slotted(cls):
+    """
+    Recreate a dataclass with __slots__ for its fields.
+    
+    Equivalent to dataclass(slots=True), which is only available on
+    Python 3.10+. Apply it above the @dataclass decorator. Like
+    dataclass(slots=True), it adds __getstate__/__setstate__ so that
+    copy and pickle also work on frozen dataclasses.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names:
+        namespace.pop(name, None)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    namespace['__slots__'] = names
+    namespace['__getstate__'] = _dataclass_getstate
+    namespace['__setstate__'] = _dataclass_setstate
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
 
 class ServiceBase:
     """Base class for services."""
@@ -63,6 +163,52 @@ class ServiceBase:
         raise NotImplementedError
 
 
+class _SingleByteEchoService(ServiceBase):
+    """Base class for services whose response is a single echoed byte.
+    
+    Subclasses define a ServiceData with exactly one field, which receives
+    the first byte of the response data.
+    """
+    
+    @classmethod
+    def interpret_response(cls, response: Response):
+        """
+        Interpret a single-byte echo response.
+        
+        Args:
+            response: Response object
+            
+        Returns:
+            ServiceData with the echoed byte
+            
+        Raises:
+            ValueError: If response data is invalid
+        """
+        if not response.positive:
+            raise ValueError("Response is not positive")
+        
+        return cls._parse(response.data)
+    
+    @classmethod
+    def _parse(cls, data: bytes):
+        """
+        Parse the data of a positive response.
+        
+        Args:
+            data: Response data (without service ID)
+            
+        Returns:
+            ServiceData with the echoed byte
+            
+        Raises:
+            ValueError: If response data is invalid
+        """
+        if len(data) < 1:
+            raise ValueError("Invalid response data length: must be at least 1 byte")
+        
+        return cls.ServiceData(data[0])
+
+
 class RoutineControl(ServiceBase):
     """RoutineControl service (0x31)."""
     
@@ -95,12 +241,12 @@ class RoutineControl(ServiceBase):
             
         Returns:
             Request object
+            
+        Raises:
+            OverflowError: If routine_id does not fit in 2 bytes
         """
         # Routine ID is 2 bytes, big-endian
-        routine_id_high = (routine_id >> 8) & 0xFF
-        routine_id_low = routine_id & 0xFF
-        
-        data = bytes([control_type, routine_id_high, routine_id_low])
+        data = _u8(control_type) + routine_id.to_bytes(2, 'big')
         return Request(cls.SERVICE_ID, data)
     
     @classmethod
@@ -117,16 +263,14 @@ class RoutineControl(ServiceBase):
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         if len(response.data) < 3:
             raise ValueError("Invalid response data length")
         
         control_type_echo = response.data[0]
-        routine_id_high = response.data[1]
-        routine_id_low = response.data[2]
-        routine_id_echo = (routine_id_high << 8) | routine_id_low
+        routine_id_echo = int.from_bytes(response.data[1:3], 'big')
         
         return cls.ServiceData(
             control_type_echo=control_type_echo,
@@ -153,7 +297,7 @@ class ECUReset(ServiceBase):
         Returns:
             Request object
         """
-        return Request(cls.SERVICE_ID, bytes([reset_type]))
+        return Request(cls.SERVICE_ID, _u8(reset_type))
     
     @classmethod
     def interpret_response(cls, response: Response) -> dict:
@@ -166,7 +310,7 @@ class ECUReset(ServiceBase):
         Returns:
             Dictionary with parsed response data
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         result = {}
@@ -211,7 +355,7 @@ class TesterPresent(ServiceBase):
                 f"Must be 0x01 (yes) or 0x02 (no)"
             )
         
-        data = bytes([response_required])
+        data = _u8(response_required)
         return Request(cls.SERVICE_ID, data)
     
     @classmethod
@@ -237,7 +381,7 @@ class TesterPresent(ServiceBase):
         Raises:
             ValueError: If response is not positive
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         # Positive response has no data bytes
@@ -277,7 +421,7 @@ class StartCommunication(ServiceBase):
         Returns:
             Dictionary with parsed response data (key bytes, etc.)
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         result = {}
@@ -314,7 +458,7 @@ class StopCommunication(ServiceBase):
         Returns:
             Dictionary with parsed response data
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         return {}
@@ -443,7 +587,7 @@ class AccessTimingParameter(ServiceBase):
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         # Positive response should have at least 6 bytes:
@@ -500,7 +644,7 @@ class SendData(ServiceBase):
         Returns:
             Dictionary with parsed response data
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         result = {}
@@ -556,9 +700,9 @@ class StartDiagnosticSession(ServiceBase):
             raise ValueError("diagnostic_mode or session_type must be provided")
         
         # Build request data: diagnosticMode (mandatory) + baudrateIdentifier (optional)
-        data = bytes([diagnostic_mode])
+        data = _u8(diagnostic_mode)
         if baudrate_identifier is not None:
-            data += bytes([baudrate_identifier])
+            data += _u8(baudrate_identifier)
         
         return Request(cls.SERVICE_ID, data)
     
@@ -579,7 +723,7 @@ class StartDiagnosticSession(ServiceBase):
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         if len(response.data) < 1:
@@ -621,7 +765,7 @@ class ReadDataByLocalIdentifier(ServiceBase):
         Returns:
             Request object
         """
-        return Request(cls.SERVICE_ID, bytes([local_identifier]))
+        return Request(cls.SERVICE_ID, _u8(local_identifier))
     
     @classmethod
     def interpret_response(cls, response: Response) -> dict:
@@ -636,7 +780,7 @@ class ReadDataByLocalIdentifier(ServiceBase):
                 - local_identifier_echo: Echo of the requested local identifier
                 - data: The data bytes read
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         result = {}
@@ -688,19 +832,13 @@ class ReadMemoryByAddress(ServiceBase):
             
         Returns:
             Request object
+            
+        Raises:
+            OverflowError: If memory_address does not fit in 3 bytes
+            ValueError: If memory_size is outside 0..255
         """
-        # Extract address bytes (High, Middle, Low)
-        memory_address_high = (memory_address >> 16) & 0xFF
-        memory_address_middle = (memory_address >> 8) & 0xFF
-        memory_address_low = memory_address & 0xFF
-        
-        # Build request data
-        data = bytes([
-            memory_address_high,
-            memory_address_middle,
-            memory_address_low,
-            memory_size & 0xFF
-        ])
+        # Address bytes (High, Middle, Low) followed by the size byte
+        data = _pack_u24(memory_address) + _u8(memory_size)
         
         # Add optional transmission mode
         if transmission_mode is not None:
@@ -727,7 +865,7 @@ class ReadMemoryByAddress(ServiceBase):
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         # Response format:
@@ -778,20 +916,13 @@ class ReadMemoryByAddress2(ServiceBase):
             
         Returns:
             Request object
+            
+        Raises:
+            OverflowError: If memory_address does not fit in 3 bytes
+            ValueError: If memory_type or memory_size is outside 0..255
         """
-        # Extract address bytes (High, Middle, Low)
-        memory_address_high = (memory_address >> 16) & 0xFF
-        memory_address_middle = (memory_address >> 8) & 0xFF
-        memory_address_low = memory_address & 0xFF
-        
-        # Build request data
-        data = bytes([
-            memory_address_high,
-            memory_address_middle,
-            memory_address_low,
-            memory_type & 0xFF,
-            memory_size & 0xFF
-        ])
+        # Address bytes (High, Middle, Low) followed by type and size bytes
+        data = _pack_u24(memory_address) + _u8(memory_type) + _u8(memory_size)
         
         return Request(cls.SERVICE_ID, data)
     
@@ -810,7 +941,7 @@ class ReadMemoryByAddress2(ServiceBase):
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         # Response format:
@@ -852,7 +983,7 @@ class StopDiagnosticSession(ServiceBase):
         Returns:
             Dictionary with parsed response data (empty for positive response)
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         return {}
@@ -867,11 +998,12 @@ class ReadFreezeFrameData(ServiceBase):
     
     SERVICE_ID = SERVICE_READ_FREEZE_FRAME_DATA
     
+    @_slotted
     @dataclass
     class ServiceData:
         """Parsed service data from response."""
         freeze_frame_number: int
-        data: bytes
+        data: Union[bytes, memoryview]
     
     @classmethod
     def make_request(cls, freeze_frame_number: int) -> Request:
@@ -884,15 +1016,21 @@ class ReadFreezeFrameData(ServiceBase):
         Returns:
             Request object
         """
-        return Request(cls.SERVICE_ID, bytes([freeze_frame_number]))
+        return Request(cls.SERVICE_ID, _u8(freeze_frame_number))
     
     @classmethod
-    def interpret_response(cls, response: Response) -> 'ReadFreezeFrameData.ServiceData':
+    def interpret_response(
+        cls,
+        response: Response,
+        zero_copy: bool = False
+    ) -> 'ReadFreezeFrameData.ServiceData':
         """
         Interpret a ReadFreezeFrameData response.
         
         Args:
             response: Response object
+            zero_copy: If True, return the payload as a memoryview into the
+                response buffer instead of copying it into a new bytes object
             
         Returns:
             ServiceData with parsed response data
@@ -900,18 +1038,39 @@ class ReadFreezeFrameData(ServiceBase):
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
-        if len(response.data) < 1:
+        return cls._parse(response.data, zero_copy)
+    
+    @classmethod
+    def _parse(cls, data: bytes, zero_copy: bool = False) -> 'ReadFreezeFrameData.ServiceData':
+        """
+        Parse the data of a positive response.
+        
+        Args:
+            data: Response data (without service ID)
+            zero_copy: If True, return the payload as a memoryview into
+                data instead of copying it into a new bytes object
+            
+        Returns:
+            ServiceData with parsed response data
+            
+        Raises:
+            ValueError: If response data is invalid
+        """
+        if len(data) < 1:
             raise ValueError("Invalid response data length: must be at least 1 byte")
         
-        freeze_frame_number = response.data[0]
-        data = response.data[1:] if len(response.data) > 1 else b''
+        freeze_frame_number = data[0]
+        if zero_copy:
+            record = memoryview(data)[1:]
+        else:
+            record = data[1:]
         
         return cls.ServiceData(
             freeze_frame_number=freeze_frame_number,
-            data=data
+            data=record
         )
 
 
@@ -920,12 +1079,12 @@ class ReadDiagnosticTroubleCodes(ServiceBase):
     
     SERVICE_ID = SERVICE_READ_DIAGNOSTIC_TROUBLE_CODES
     
-    @dataclass
-    class DTC:
+    class DTC(NamedTuple):
         """Diagnostic Trouble Code."""
         code: int  # 2-byte DTC code
         status: Optional[int] = None  # Status byte if available
     
+    @_slotted
     @dataclass
     class ServiceData:
         """Parsed service data from response."""
@@ -958,19 +1117,31 @@ class ReadDiagnosticTroubleCodes(ServiceBase):
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
-        if len(response.data) == 0:
-            return cls.ServiceData(dtcs=[])
+        return cls._parse(response.data)
+    
+    @classmethod
+    def _parse(cls, data: bytes) -> 'ReadDiagnosticTroubleCodes.ServiceData':
+        """
+        Parse the data of a positive response.
         
-        dtcs = []
-        data = response.data
+        Args:
+            data: Response data (without service ID)
+            
+        Returns:
+            ServiceData with parsed DTCs
+        """
+        n = len(data)
+        
+        if n == 0:
+            return cls.ServiceData(dtcs=[])
         
         # Check if first byte is DTC count
         # If data length is odd, first byte is likely DTC count
         # If data length is even, all bytes are DTC pairs
-        if len(data) % 2 == 1:
+        if n & 1:
             # First byte is DTC count, rest are DTC pairs
             dtc_count = data[0]
             dtc_data = data[1:]
@@ -979,13 +1150,8 @@ class ReadDiagnosticTroubleCodes(ServiceBase):
             dtc_count = None
             dtc_data = data
         
-        # Parse DTC pairs (2 bytes each)
-        for i in range(0, len(dtc_data), 2):
-            if i + 1 < len(dtc_data):
-                dtc_high = dtc_data[i]
-                dtc_low = dtc_data[i + 1]
-                dtc_code = (dtc_high << 8) | dtc_low
-                dtcs.append(cls.DTC(code=dtc_code))
+        # Parse DTC pairs (2 bytes each); dtc_data always has an even length here
+        dtcs = [cls.DTC(code) for (code,) in _U16.iter_unpack(dtc_data)]
         
         return cls.ServiceData(dtcs=dtcs)
 
@@ -1006,7 +1172,7 @@ class ClearDiagnosticInformation(ServiceBase):
         Returns:
             Request object
         """
-        return Request(cls.SERVICE_ID, bytes([group_of_dtc]))
+        return Request(cls.SERVICE_ID, _u8(group_of_dtc))
     
     @classmethod
     def interpret_response(cls, response: Response) -> dict:
@@ -1019,21 +1185,35 @@ class ClearDiagnosticInformation(ServiceBase):
         Returns:
             Dictionary with parsed response data
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
+        return cls._parse(response.data)
+    
+    @classmethod
+    def _parse(cls, data: bytes) -> dict:
+        """
+        Parse the data of a positive response.
+        
+        Args:
+            data: Response data (without service ID)
+            
+        Returns:
+            Dictionary with parsed response data
+        """
         result = {}
-        if len(response.data) > 0:
-            result['group_of_dtc_echo'] = response.data[0]
+        if len(data) > 0:
+            result['group_of_dtc_echo'] = data[0]
         
         return result
 
 
-class ReadStatusOfDiagnosticTroubleCodes(ServiceBase):
+class ReadStatusOfDiagnosticTroubleCodes(_SingleByteEchoService):
     """ReadStatusOfDiagnosticTroubleCodes service (0x17)."""
     
     SERVICE_ID = SERVICE_READ_STATUS_OF_DIAGNOSTIC_TROUBLE_CODES
     
+    @_slotted
     @dataclass
     class ServiceData:
         """Parsed service data from response."""
@@ -1048,28 +1228,6 @@ class ReadStatusOfDiagnosticTroubleCodes(ServiceBase):
             Request object
         """
         return Request(cls.SERVICE_ID, b'')
-    
-    @classmethod
-    def interpret_response(cls, response: Response) -> 'ReadStatusOfDiagnosticTroubleCodes.ServiceData':
-        """
-        Interpret a ReadStatusOfDiagnosticTroubleCodes response.
-        
-        Args:
-            response: Response object
-            
-        Returns:
-            ServiceData with status byte
-            
-        Raises:
-            ValueError: If response data is invalid
-        """
-        if not response.is_positive():
-            raise ValueError("Response is not positive")
-        
-        if len(response.data) < 1:
-            raise ValueError("Invalid response data length: must be at least 1 byte")
-        
-        return cls.ServiceData(status=response.data[0])
 
 
 class ReadDiagnosticTroubleCodesByStatus(ServiceBase):
@@ -1077,12 +1235,12 @@ class ReadDiagnosticTroubleCodesByStatus(ServiceBase):
     
     SERVICE_ID = SERVICE_READ_DIAGNOSTIC_TROUBLE_CODES_BY_STATUS
     
-    @dataclass
-    class DTC:
+    class DTC(NamedTuple):
         """Diagnostic Trouble Code with status."""
         code: int  # 2-byte DTC code
         status: int  # Status byte
     
+    @_slotted
     @dataclass
     class ServiceData:
         """Parsed service data from response."""
@@ -1099,7 +1257,7 @@ class ReadDiagnosticTroubleCodesByStatus(ServiceBase):
         Returns:
             Request object
         """
-        return Request(cls.SERVICE_ID, bytes([status_mask]))
+        return Request(cls.SERVICE_ID, _u8(status_mask))
     
     @classmethod
     def interpret_response(cls, response: Response) -> 'ReadDiagnosticTroubleCodesByStatus.ServiceData':
@@ -1118,35 +1276,41 @@ class ReadDiagnosticTroubleCodesByStatus(ServiceBase):
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
-        if len(response.data) == 0:
-            return cls.ServiceData(dtcs=[])
+        return cls._parse(response.data)
+    
+    @classmethod
+    def _parse(cls, data: bytes) -> 'ReadDiagnosticTroubleCodesByStatus.ServiceData':
+        """
+        Parse the data of a positive response.
         
-        dtcs = []
-        data = response.data
+        Args:
+            data: Response data (without service ID)
+            
+        Returns:
+            ServiceData with parsed DTCs
+        """
+        n = len(data)
+        
+        if n == 0:
+            return cls.ServiceData(dtcs=[])
         
         # Check if first byte is DTC count
         # If data length % 3 == 1, first byte is likely DTC count
         # If data length % 3 == 0, all bytes are DTC triplets
-        if len(data) % 3 == 1:
+        if n % 3 == 1:
             # First byte is DTC count, rest are DTC triplets
             dtc_count = data[0]
             dtc_data = data[1:]
         else:
-            # All bytes are DTC triplets
+            # All bytes are DTC triplets; a trailing partial triplet is ignored
             dtc_count = None
-            dtc_data = data
+            dtc_data = data[:n - n % 3]
         
         # Parse DTC triplets (2 bytes code + 1 byte status)
-        for i in range(0, len(dtc_data), 3):
-            if i + 2 < len(dtc_data):
-                dtc_high = dtc_data[i]
-                dtc_low = dtc_data[i + 1]
-                dtc_code = (dtc_high << 8) | dtc_low
-                status = dtc_data[i + 2]
-                dtcs.append(cls.DTC(code=dtc_code, status=status))
+        dtcs = [cls.DTC(code, status) for code, status in _DTC_TRIPLET.iter_unpack(dtc_data)]
         
         return cls.ServiceData(dtcs=dtcs)
 
@@ -1160,11 +1324,12 @@ class ReadDataByCommonIdentifier(ServiceBase):
     
     SERVICE_ID = SERVICE_READ_DATA_BY_COMMON_IDENTIFIER
     
+    @_slotted
     @dataclass
     class ServiceData:
         """Parsed service data from response."""
         common_identifier_echo: int
-        data: bytes
+        data: Union[bytes, memoryview]
     
     @classmethod
     def make_request(cls, common_identifier: int) -> Request:
@@ -1172,20 +1337,29 @@ class ReadDataByCommonIdentifier(ServiceBase):
         Create a ReadDataByCommonIdentifier request.
         
         Args:
-            common_identifier: Common identifier (1 byte)
+            common_identifier: Common identifier (2 bytes)
             
         Returns:
             Request object
+            
+        Raises:
+            OverflowError: If common_identifier does not fit in 2 bytes
         """
-        return Request(cls.SERVICE_ID, common_identifier.to_bytes(2, byteorder='big'))
+        return Request(cls.SERVICE_ID, common_identifier.to_bytes(2, 'big'))
     
     @classmethod
-    def interpret_response(cls, response: Response) -> 'ReadDataByCommonIdentifier.ServiceData':
+    def interpret_response(
+        cls,
+        response: Response,
+        zero_copy: bool = False
+    ) -> 'ReadDataByCommonIdentifier.ServiceData':
         """
         Interpret a ReadDataByCommonIdentifier response.
         
         Args:
             response: Response object
+            zero_copy: If True, return the payload as a memoryview into the
+                response buffer instead of copying it into a new bytes object
             
         Returns:
             ServiceData with parsed response data
@@ -1193,26 +1367,46 @@ class ReadDataByCommonIdentifier(ServiceBase):
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
-        if len(response.data) < 1:
-            raise ValueError("Invalid response data length: must be at least 1 byte")
+        return cls._parse(response.data, zero_copy)
+    
+    @classmethod
+    def _parse(cls, data: bytes, zero_copy: bool = False) -> 'ReadDataByCommonIdentifier.ServiceData':
+        """
+        Parse the data of a positive response.
         
-        common_identifier_echo = response.data[0]
-        data = response.data[1:] if len(response.data) > 1 else b''
+        Args:
+            data: Response data (without service ID)
+            zero_copy: If True, return the payload as a memoryview into
+                data instead of copying it into a new bytes object
+            
+        Returns:
+            ServiceData with parsed response data
+            
+        Raises:
+            ValueError: If response data is invalid
+        """
+        # Response format: commonIdentifier echo (2 bytes) + record
+        if len(data) < 2:
+            raise ValueError("Invalid response data length: must be at least 2 bytes")
+        
+        common_identifier_echo = _U16.unpack_from(data)[0]
+        record = memoryview(data)[2:] if zero_copy else data[2:]
         
         return cls.ServiceData(
             common_identifier_echo=common_identifier_echo,
-            data=data
+            data=record
         )
 
 
-class SetDataRates(ServiceBase):
+class SetDataRates(_SingleByteEchoService):
     """SetDataRates service (0x26)."""
     
     SERVICE_ID = SERVICE_SET_DATA_RATES
     
+    @_slotted
     @dataclass
     class ServiceData:
         """Parsed service data from response."""
@@ -1229,36 +1423,15 @@ class SetDataRates(ServiceBase):
         Returns:
             Request object
         """
-        return Request(cls.SERVICE_ID, bytes([data_rate_identifier]))
-    
-    @classmethod
-    def interpret_response(cls, response: Response) -> 'SetDataRates.ServiceData':
-        """
-        Interpret a SetDataRates response.
-        
-        Args:
-            response: Response object
-            
-        Returns:
-            ServiceData with parsed response data
-            
-        Raises:
-            ValueError: If response data is invalid
-        """
-        if not response.is_positive():
-            raise ValueError("Response is not positive")
-        
-        if len(response.data) < 1:
-            raise ValueError("Invalid response data length: must be at least 1 byte")
-        
-        return cls.ServiceData(data_rate_identifier_echo=response.data[0])
+        return Request(cls.SERVICE_ID, _u8(data_rate_identifier))
 
 
-class WriteDataByCommonIdentifier(ServiceBase):
+class WriteDataByCommonIdentifier(_SingleByteEchoService):
     """WriteDataByCommonIdentifier service (0x2E)."""
     
     SERVICE_ID = SERVICE_WRITE_DATA_BY_COMMON_IDENTIFIER
     
+    @_slotted
     @dataclass
     class ServiceData:
         """Parsed service data from response."""
@@ -1276,36 +1449,15 @@ class WriteDataByCommonIdentifier(ServiceBase):
         Returns:
             Request object
         """
-        return Request(cls.SERVICE_ID, bytes([common_identifier]) + data)
-    
-    @classmethod
-    def interpret_response(cls, response: Response) -> 'WriteDataByCommonIdentifier.ServiceData':
-        """
-        Interpret a WriteDataByCommonIdentifier response.
-        
-        Args:
-            response: Response object
-            
-        Returns:
-            ServiceData with parsed response data
-            
-        Raises:
-            ValueError: If response data is invalid
-        """
-        if not response.is_positive():
-            raise ValueError("Response is not positive")
-        
-        if len(response.data) < 1:
-            raise ValueError("Invalid response data length: must be at least 1 byte")
-        
-        return cls.ServiceData(common_identifier_echo=response.data[0])
+        return Request(cls.SERVICE_ID, _u8(common_identifier) + data)
 
 
-class WriteDataByLocalIdentifier(ServiceBase):
+class WriteDataByLocalIdentifier(_SingleByteEchoService):
     """WriteDataByLocalIdentifier service (0x3B)."""
     
     SERVICE_ID = SERVICE_WRITE_DATA_BY_LOCAL_IDENTIFIER
     
+    @_slotted
     @dataclass
     class ServiceData:
         """Parsed service data from response."""
@@ -1323,29 +1475,7 @@ class WriteDataByLocalIdentifier(ServiceBase):
         Returns:
             Request object
         """
-        return Request(cls.SERVICE_ID, bytes([local_identifier]) + data)
-    
-    @classmethod
-    def interpret_response(cls, response: Response) -> 'WriteDataByLocalIdentifier.ServiceData':
-        """
-        Interpret a WriteDataByLocalIdentifier response.
-        
-        Args:
-            response: Response object
-            
-        Returns:
-            ServiceData with parsed response data
-            
-        Raises:
-            ValueError: If response data is invalid
-        """
-        if not response.is_positive():
-            raise ValueError("Response is not positive")
-        
-        if len(response.data) < 1:
-            raise ValueError("Invalid response data length: must be at least 1 byte")
-        
-        return cls.ServiceData(local_identifier_echo=response.data[0])
+        return Request(cls.SERVICE_ID, _u8(local_identifier) + data)
 
 
 class WriteMemoryByAddress(ServiceBase):
@@ -1353,6 +1483,7 @@ class WriteMemoryByAddress(ServiceBase):
     
     SERVICE_ID = SERVICE_WRITE_MEMORY_BY_ADDRESS
     
+    @_slotted
     @dataclass
     class ServiceData:
         """Parsed service data from response."""
@@ -1375,19 +1506,13 @@ class WriteMemoryByAddress(ServiceBase):
             
         Returns:
             Request object
+            
+        Raises:
+            OverflowError: If memory_address does not fit in 3 bytes
+            ValueError: If memory_size is outside 0..255
         """
-        # Extract address bytes (High, Middle, Low)
-        memory_address_high = (memory_address >> 16) & 0xFF
-        memory_address_middle = (memory_address >> 8) & 0xFF
-        memory_address_low = memory_address & 0xFF
-        
-        # Build request data
-        request_data = bytes([
-            memory_address_high,
-            memory_address_middle,
-            memory_address_low,
-            memory_size & 0xFF
-        ]) + data
+        # Build request data: address (High, Middle, Low) + size, then data
+        request_data = _pack_u24(memory_address) + _u8(memory_size) + data
         
         return Request(cls.SERVICE_ID, request_data)
     
@@ -1405,17 +1530,30 @@ class WriteMemoryByAddress(ServiceBase):
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
+        return cls._parse(response.data)
+    
+    @classmethod
+    def _parse(cls, data: bytes) -> 'WriteMemoryByAddress.ServiceData':
+        """
+        Parse the data of a positive response.
+        
+        Args:
+            data: Response data (without service ID)
+            
+        Returns:
+            ServiceData with parsed response data
+            
+        Raises:
+            ValueError: If response data is invalid
+        """
         # Response format: memoryAddress echo (High, Middle, Low)
-        if len(response.data) < 3:
+        if len(data) < 3:
             raise ValueError("Invalid response data length: must be at least 3 bytes")
         
-        memory_address_high = response.data[0]
-        memory_address_middle = response.data[1]
-        memory_address_low = response.data[2]
-        memory_address_echo = (memory_address_high << 16) | (memory_address_middle << 8) | memory_address_low
+        memory_address_echo = _unpack_u24(data)
         
         return cls.ServiceData(memory_address_echo=memory_address_echo)
 
@@ -1429,12 +1567,13 @@ class InputOutputControlByCommonIdentifier(ServiceBase):
     
     SERVICE_ID = SERVICE_INPUT_OUTPUT_CONTROL_BY_COMMON_IDENTIFIER
     
+    @_slotted
     @dataclass
     class ServiceData:
         """Parsed service data from response."""
         common_identifier_echo: int
         control_parameter_echo: int
-        control_state_echo: Optional[bytes] = None
+        control_state_echo: Optional[Union[bytes, memoryview]] = None
     
     @classmethod
     def make_request(
@@ -1454,18 +1593,22 @@ class InputOutputControlByCommonIdentifier(ServiceBase):
         Returns:
             Request object
         """
-        data = bytes([common_identifier, control_parameter])
-        if control_state:
-            data += control_state
-        return Request(cls.SERVICE_ID, data)
+        header = bytes((common_identifier, control_parameter))
+        return Request(cls.SERVICE_ID, header + control_state if control_state else header)
     
     @classmethod
-    def interpret_response(cls, response: Response) -> 'InputOutputControlByCommonIdentifier.ServiceData':
+    def interpret_response(
+        cls,
+        response: Response,
+        zero_copy: bool = False
+    ) -> 'InputOutputControlByCommonIdentifier.ServiceData':
         """
         Interpret an InputOutputControlByCommonIdentifier response.
         
         Args:
             response: Response object
+            zero_copy: If True, return the control state echo as a memoryview
+                into the response buffer instead of copying it
             
         Returns:
             ServiceData with parsed response data
@@ -1473,15 +1616,38 @@ class InputOutputControlByCommonIdentifier(ServiceBase):
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
-        if len(response.data) < 2:
+        return cls._parse(response.data, zero_copy)
+    
+    @classmethod
+    def _parse(cls, data: bytes, zero_copy: bool = False) -> 'InputOutputControlByCommonIdentifier.ServiceData':
+        """
+        Parse the data of a positive response.
+        
+        Args:
+            data: Response data (without service ID)
+            zero_copy: If True, return the control state echo as a memoryview
+                into data instead of copying it
+            
+        Returns:
+            ServiceData with parsed response data
+            
+        Raises:
+            ValueError: If response data is invalid
+        """
+        n = len(data)
+        
+        if n < 2:
             raise ValueError("Invalid response data length: must be at least 2 bytes")
         
-        common_identifier_echo = response.data[0]
-        control_parameter_echo = response.data[1]
-        control_state_echo = response.data[2:] if len(response.data) > 2 else None
+        common_identifier_echo = data[0]
+        control_parameter_echo = data[1]
+        if n > 2:
+            control_state_echo = memoryview(data)[2:] if zero_copy else data[2:]
+        else:
+            control_state_echo = None
         
         return cls.ServiceData(
             common_identifier_echo=common_identifier_echo,
@@ -1495,12 +1661,13 @@ class InputOutputControlByLocalIdentifier(ServiceBase):
     
     SERVICE_ID = SERVICE_INPUT_OUTPUT_CONTROL_BY_LOCAL_IDENTIFIER
     
+    @_slotted
     @dataclass
     class ServiceData:
         """Parsed service data from response."""
         local_identifier_echo: int
         control_parameter_echo: int
-        control_state_echo: Optional[bytes] = None
+        control_state_echo: Optional[Union[bytes, memoryview]] = None
     
     @classmethod
     def make_request(
@@ -1520,18 +1687,22 @@ class InputOutputControlByLocalIdentifier(ServiceBase):
         Returns:
             Request object
         """
-        data = bytes([local_identifier, control_parameter])
-        if control_state:
-            data += control_state
-        return Request(cls.SERVICE_ID, data)
+        header = bytes((local_identifier, control_parameter))
+        return Request(cls.SERVICE_ID, header + control_state if control_state else header)
     
     @classmethod
-    def interpret_response(cls, response: Response) -> 'InputOutputControlByLocalIdentifier.ServiceData':
+    def interpret_response(
+        cls,
+        response: Response,
+        zero_copy: bool = False
+    ) -> 'InputOutputControlByLocalIdentifier.ServiceData':
         """
         Interpret an InputOutputControlByLocalIdentifier response.
         
         Args:
             response: Response object
+            zero_copy: If True, return the control state echo as a memoryview
+                into the response buffer instead of copying it
             
         Returns:
             ServiceData with parsed response data
@@ -1539,15 +1710,38 @@ class InputOutputControlByLocalIdentifier(ServiceBase):
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
-        if len(response.data) < 2:
+        return cls._parse(response.data, zero_copy)
+    
+    @classmethod
+    def _parse(cls, data: bytes, zero_copy: bool = False) -> 'InputOutputControlByLocalIdentifier.ServiceData':
+        """
+        Parse the data of a positive response.
+        
+        Args:
+            data: Response data (without service ID)
+            zero_copy: If True, return the control state echo as a memoryview
+                into data instead of copying it
+            
+        Returns:
+            ServiceData with parsed response data
+            
+        Raises:
+            ValueError: If response data is invalid
+        """
+        n = len(data)
+        
+        if n < 2:
             raise ValueError("Invalid response data length: must be at least 2 bytes")
         
-        local_identifier_echo = response.data[0]
-        control_parameter_echo = response.data[1]
-        control_state_echo = response.data[2:] if len(response.data) > 2 else None
+        local_identifier_echo = data[0]
+        control_parameter_echo = data[1]
+        if n > 2:
+            control_state_echo = memoryview(data)[2:] if zero_copy else data[2:]
+        else:
+            control_state_echo = None
         
         return cls.ServiceData(
             local_identifier_echo=local_identifier_echo,
@@ -1565,7 +1759,8 @@ class StopRoutineByLocalIdentifier(ServiceBase):
     
     SERVICE_ID = SERVICE_STOP_ROUTINE_BY_LOCAL_IDENTIFIER
     
-    @dataclass
+    @_slotted
+    @dataclass(frozen=True)
     class ServiceData:
         """Parsed service data from response."""
         routine_id_echo: int
@@ -1580,11 +1775,11 @@ class StopRoutineByLocalIdentifier(ServiceBase):
             
         Returns:
             Request object
+            
+        Raises:
+            OverflowError: If routine_id does not fit in 2 bytes
         """
-        routine_id_high = (routine_id >> 8) & 0xFF
-        routine_id_low = routine_id & 0xFF
-        data = bytes([routine_id_high, routine_id_low])
-        return Request(cls.SERVICE_ID, data)
+        return Request(cls.SERVICE_ID, routine_id.to_bytes(2, 'big'))
     
     @classmethod
     def interpret_response(cls, response: Response) -> 'StopRoutineByLocalIdentifier.ServiceData':
@@ -1600,15 +1795,13 @@ class StopRoutineByLocalIdentifier(ServiceBase):
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         if len(response.data) < 2:
             raise ValueError("Invalid response data length: must be at least 2 bytes")
         
-        routine_id_high = response.data[0]
-        routine_id_low = response.data[1]
-        routine_id_echo = (routine_id_high << 8) | routine_id_low
+        routine_id_echo = int.from_bytes(response.data[:2], 'big')
         
         return cls.ServiceData(routine_id_echo=routine_id_echo)
 
@@ -1618,11 +1811,12 @@ class RequestRoutineResultsByLocalIdentifier(ServiceBase):
     
     SERVICE_ID = SERVICE_REQUEST_ROUTINE_RESULTS_BY_LOCAL_IDENTIFIER
     
-    @dataclass
+    @_slotted
+    @dataclass(frozen=True)
     class ServiceData:
         """Parsed service data from response."""
         routine_id_echo: int
-        routine_results: bytes
+        routine_results: Union[bytes, memoryview]
     
     @classmethod
     def make_request(cls, routine_id: int) -> Request:
@@ -1634,19 +1828,25 @@ class RequestRoutineResultsByLocalIdentifier(ServiceBase):
             
         Returns:
             Request object
+            
+        Raises:
+            OverflowError: If routine_id does not fit in 2 bytes
         """
-        routine_id_high = (routine_id >> 8) & 0xFF
-        routine_id_low = routine_id & 0xFF
-        data = bytes([routine_id_high, routine_id_low])
-        return Request(cls.SERVICE_ID, data)
+        return Request(cls.SERVICE_ID, routine_id.to_bytes(2, 'big'))
     
     @classmethod
-    def interpret_response(cls, response: Response) -> 'RequestRoutineResultsByLocalIdentifier.ServiceData':
+    def interpret_response(
+        cls,
+        response: Response,
+        zero_copy: bool = False
+    ) -> 'RequestRoutineResultsByLocalIdentifier.ServiceData':
         """
         Interpret a RequestRoutineResultsByLocalIdentifier response.
         
         Args:
             response: Response object
+            zero_copy: If True, return the routine results as a memoryview into the
+                response buffer instead of copying it into a new bytes object
             
         Returns:
             ServiceData with parsed response data
@@ -1654,16 +1854,17 @@ class RequestRoutineResultsByLocalIdentifier(ServiceBase):
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         if len(response.data) < 2:
             raise ValueError("Invalid response data length: must be at least 2 bytes")
         
-        routine_id_high = response.data[0]
-        routine_id_low = response.data[1]
-        routine_id_echo = (routine_id_high << 8) | routine_id_low
-        routine_results = response.data[2:] if len(response.data) > 2 else b''
+        routine_id_echo = int.from_bytes(response.data[:2], 'big')
+        if zero_copy:
+            routine_results = memoryview(response.data)[2:]
+        else:
+            routine_results = response.data[2:]
         
         return cls.ServiceData(
             routine_id_echo=routine_id_echo,
@@ -1671,165 +1872,127 @@ class RequestRoutineResultsByLocalIdentifier(ServiceBase):
         )
 
 
-class StartRoutineByAddress(ServiceBase):
-    """StartRoutineByAddress service (0x38)."""
-    
-    SERVICE_ID = SERVICE_START_ROUTINE_BY_ADDRESS
-    
-    @dataclass
-    class ServiceData:
-        """Parsed service data from response."""
-        memory_address_echo: int
+class _RoutineByAddressService(ServiceBase):
+    """Base class for routine services addressed by a 24-bit memory address."""
     
     @classmethod
-    def make_request(
-        cls,
-        memory_address: int,
-        routine_control_option_record: Optional[bytes] = None
-    ) -> Request:
+    def make_request(cls, memory_address: int) -> Request:
         """
-        Create a StartRoutineByAddress request.
+        Create a routine-by-address request.
         
         Args:
             memory_address: Memory address (24-bit, 3 bytes)
-            routine_control_option_record: Optional routine control option record bytes
             
         Returns:
             Request object
+            
+        Raises:
+            OverflowError: If memory_address does not fit in 3 bytes
         """
-        # Extract address bytes (High, Middle, Low)
-        memory_address_high = (memory_address >> 16) & 0xFF
-        memory_address_middle = (memory_address >> 8) & 0xFF
-        memory_address_low = memory_address & 0xFF
-        
-        data = bytes([memory_address_high, memory_address_middle, memory_address_low])
-        if routine_control_option_record:
-            data += routine_control_option_record
-        
+        # Address bytes (High, Middle, Low)
+        data = _pack_u24(memory_address)
         return Request(cls.SERVICE_ID, data)
     
     @classmethod
-    def interpret_response(cls, response: Response) -> 'StartRoutineByAddress.ServiceData':
+    def interpret_response(cls, response: Response):
         """
-        Interpret a StartRoutineByAddress response.
+        Interpret a routine-by-address response.
         
         Args:
             response: Response object
             
         Returns:
-            ServiceData with parsed response data
+            ServiceData with the memory address echo
             
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         if len(response.data) < 3:
             raise ValueError("Invalid response data length: must be at least 3 bytes")
         
-        memory_address_high = response.data[0]
-        memory_address_middle = response.data[1]
-        memory_address_low = response.data[2]
-        memory_address_echo = (memory_address_high << 16) | (memory_address_middle << 8) | memory_address_low
+        memory_address_echo = _unpack_u24(response.data)
         
         return cls.ServiceData(memory_address_echo=memory_address_echo)
 
 
-class StopRoutineByAddress(ServiceBase):
-    """StopRoutineByAddress service (0x39)."""
+class StartRoutineByAddress(_RoutineByAddressService):
+    """StartRoutineByAddress service (0x38)."""
     
-    SERVICE_ID = SERVICE_STOP_ROUTINE_BY_ADDRESS
+    SERVICE_ID = SERVICE_START_ROUTINE_BY_ADDRESS
     
-    @dataclass
+    @_slotted
+    @dataclass(frozen=True)
     class ServiceData:
         """Parsed service data from response."""
         memory_address_echo: int
     
     @classmethod
-    def make_request(cls, memory_address: int) -> Request:
+    def make_request(
+        cls,
+        memory_address: int,
+        routine_control_option_record: Optional[bytes] = None
+    ) -> Request:
         """
-        Create a StopRoutineByAddress request.
+        Create a StartRoutineByAddress request.
         
         Args:
             memory_address: Memory address (24-bit, 3 bytes)
+            routine_control_option_record: Optional routine control option record bytes
             
         Returns:
             Request object
-        """
-        # Extract address bytes (High, Middle, Low)
-        memory_address_high = (memory_address >> 16) & 0xFF
-        memory_address_middle = (memory_address >> 8) & 0xFF
-        memory_address_low = memory_address & 0xFF
-        
-        data = bytes([memory_address_high, memory_address_middle, memory_address_low])
-        return Request(cls.SERVICE_ID, data)
-    
-    @classmethod
-    def interpret_response(cls, response: Response) -> 'StopRoutineByAddress.ServiceData':
-        """
-        Interpret a StopRoutineByAddress response.
-        
-        Args:
-            response: Response object
-            
-        Returns:
-            ServiceData with parsed response data
             
         Raises:
-            ValueError: If response data is invalid
+            OverflowError: If memory_address does not fit in 3 bytes
         """
-        if not response.is_positive():
-            raise ValueError("Response is not positive")
-        
-        if len(response.data) < 3:
-            raise ValueError("Invalid response data length: must be at least 3 bytes")
-        
-        memory_address_high = response.data[0]
-        memory_address_middle = response.data[1]
-        memory_address_low = response.data[2]
-        memory_address_echo = (memory_address_high << 16) | (memory_address_middle << 8) | memory_address_low
+        # Address bytes (High, Middle, Low)
+        data = _pack_u24(memory_address)
+        if routine_control_option_record:
+            data += routine_control_option_record
         
-        return cls.ServiceData(memory_address_echo=memory_address_echo)
+        return Request(cls.SERVICE_ID, data)
+
+
+class StopRoutineByAddress(_RoutineByAddressService):
+    """StopRoutineByAddress service (0x39)."""
+    
+    SERVICE_ID = SERVICE_STOP_ROUTINE_BY_ADDRESS
+    
+    @_slotted
+    @dataclass(frozen=True)
+    class ServiceData:
+        """Parsed service data from response."""
+        memory_address_echo: int
 
 
-class RequestRoutineResultsByAddress(ServiceBase):
+class RequestRoutineResultsByAddress(_RoutineByAddressService):
     """RequestRoutineResultsByAddress service (0x3A)."""
     
     SERVICE_ID = SERVICE_REQUEST_ROUTINE_RESULTS_BY_ADDRESS
     
-    @dataclass
+    @_slotted
+    @dataclass(frozen=True)
     class ServiceData:
         """Parsed service data from response."""
         memory_address_echo: int
-        routine_results: bytes
-    
-    @classmethod
-    def make_request(cls, memory_address: int) -> Request:
-        """
-        Create a RequestRoutineResultsByAddress request.
-        
-        Args:
-            memory_address: Memory address (24-bit, 3 bytes)
-            
-        Returns:
-            Request object
-        """
-        # Extract address bytes (High, Middle, Low)
-        memory_address_high = (memory_address >> 16) & 0xFF
-        memory_address_middle = (memory_address >> 8) & 0xFF
-        memory_address_low = memory_address & 0xFF
-        
-        data = bytes([memory_address_high, memory_address_middle, memory_address_low])
-        return Request(cls.SERVICE_ID, data)
+        routine_results: Union[bytes, memoryview]
     
     @classmethod
-    def interpret_response(cls, response: Response) -> 'RequestRoutineResultsByAddress.ServiceData':
+    def interpret_response(
+        cls,
+        response: Response,
+        zero_copy: bool = False
+    ) -> 'RequestRoutineResultsByAddress.ServiceData':
         """
         Interpret a RequestRoutineResultsByAddress response.
         
         Args:
             response: Response object
+            zero_copy: If True, return the routine results as a memoryview into the
+                response buffer instead of copying it into a new bytes object
             
         Returns:
             ServiceData with parsed response data
@@ -1837,17 +2000,17 @@ class RequestRoutineResultsByAddress(ServiceBase):
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         if len(response.data) < 3:
             raise ValueError("Invalid response data length: must be at least 3 bytes")
         
-        memory_address_high = response.data[0]
-        memory_address_middle = response.data[1]
-        memory_address_low = response.data[2]
-        memory_address_echo = (memory_address_high << 16) | (memory_address_middle << 8) | memory_address_low
-        routine_results = response.data[3:] if len(response.data) > 3 else b''
+        memory_address_echo = _unpack_u24(response.data)
+        if zero_copy:
+            routine_results = memoryview(response.data)[3:]
+        else:
+            routine_results = response.data[3:]
         
         return cls.ServiceData(
             memory_address_echo=memory_address_echo,
@@ -1859,17 +2022,8 @@ class RequestRoutineResultsByAddress(ServiceBase):
 # Upload/Download Services
 # ============================================================================
 
-class RequestDownload(ServiceBase):
-    """RequestDownload service (0x34)."""
-    
-    SERVICE_ID = SERVICE_REQUEST_DOWNLOAD
-    
-    @dataclass
-    class ServiceData:
-        """Parsed service data from response."""
-        memory_address_echo: int
-        memory_size_echo: int
-        max_number_of_block_length: Optional[int] = None
+class _TransferRequestService(ServiceBase):
+    """Base class for RequestDownload and RequestUpload, which share a layout."""
     
     @classmethod
     def make_request(
@@ -1880,7 +2034,7 @@ class RequestDownload(ServiceBase):
         encryption_method: Optional[int] = None
     ) -> Request:
         """
-        Create a RequestDownload request.
+        Create a transfer request.
         
         Args:
             memory_address: Memory address (24-bit, 3 bytes)
@@ -1890,37 +2044,43 @@ class RequestDownload(ServiceBase):
             
         Returns:
             Request object
-        """
-        # Extract address bytes (High, Middle, Low)
-        memory_address_high = (memory_address >> 16) & 0xFF
-        memory_address_middle = (memory_address >> 8) & 0xFF
-        memory_address_low = memory_address & 0xFF
-        
-        # Extract size bytes (High, Middle, Low)
-        memory_size_high = (memory_size >> 16) & 0xFF
-        memory_size_middle = (memory_size >> 8) & 0xFF
-        memory_size_low = memory_size & 0xFF
-        
-        data = bytes([
-            memory_address_high,
-            memory_address_middle,
-            memory_address_low,
-            memory_size_high,
-            memory_size_middle,
-            memory_size_low
-        ])
-        
-        if compression_method is not None:
-            data += bytes([compression_method])
-        if encryption_method is not None:
-            data += bytes([encryption_method])
+            
+        Raises:
+            OverflowError: If memory_address or memory_size does not fit in 3 bytes
+            ValueError: If a method byte is outside 0..255
+        """
+        # Range-check up front so each combination is a single pack call
+        memory_address = _check_u24(memory_address)
+        memory_size = _check_u24(memory_size)
+        address_high, address_low = memory_address >> 16, memory_address & 0xFFFF
+        size_high, size_low = memory_size >> 16, memory_size & 0xFFFF
+        
+        # Address bytes (High, Middle, Low), size bytes (High, Middle, Low),
+        # then the optional method bytes in protocol order
+        if compression_method is not None and encryption_method is not None:
+            data = _ADDR24_SIZE24_METHODS.pack(
+                address_high, address_low, size_high, size_low,
+                _check_u8(compression_method), _check_u8(encryption_method)
+            )
+        elif compression_method is not None:
+            data = _ADDR24_SIZE24_METHOD.pack(
+                address_high, address_low, size_high, size_low,
+                _check_u8(compression_method)
+            )
+        elif encryption_method is not None:
+            data = _ADDR24_SIZE24_METHOD.pack(
+                address_high, address_low, size_high, size_low,
+                _check_u8(encryption_method)
+            )
+        else:
+            data = _ADDR24_SIZE24.pack(address_high, address_low, size_high, size_low)
         
         return Request(cls.SERVICE_ID, data)
     
     @classmethod
-    def interpret_response(cls, response: Response) -> 'RequestDownload.ServiceData':
+    def interpret_response(cls, response: Response):
         """
-        Interpret a RequestDownload response.
+        Interpret a transfer request response.
         
         Args:
             response: Response object
@@ -1931,27 +2091,23 @@ class RequestDownload(ServiceBase):
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
-        if len(response.data) < 6:
-            raise ValueError("Invalid response data length: must be at least 6 bytes")
+        data = response.data
+        n = len(data)
         
-        # Parse memory address echo
-        memory_address_high = response.data[0]
-        memory_address_middle = response.data[1]
-        memory_address_low = response.data[2]
-        memory_address_echo = (memory_address_high << 16) | (memory_address_middle << 8) | memory_address_low
+        if n < 6:
+            raise ValueError("Invalid response data length: must be at least 6 bytes")
         
-        # Parse memory size echo
-        memory_size_high = response.data[3]
-        memory_size_middle = response.data[4]
-        memory_size_low = response.data[5]
-        memory_size_echo = (memory_size_high << 16) | (memory_size_middle << 8) | memory_size_low
+        # Parse memory address and memory size echoes in one pass
+        address_high, address_low, size_high, size_low = _ADDR24_SIZE24.unpack_from(data)
+        memory_address_echo = (address_high << 16) | address_low
+        memory_size_echo = (size_high << 16) | size_low
         
         max_number_of_block_length = None
-        if len(response.data) >= 7:
-            max_number_of_block_length = response.data[6]
+        if n >= 7:
+            max_number_of_block_length = data[6]
         
         return cls.ServiceData(
             memory_address_echo=memory_address_echo,
@@ -1960,105 +2116,32 @@ class RequestDownload(ServiceBase):
         )
 
 
-class RequestUpload(ServiceBase):
-    """RequestUpload service (0x35)."""
+class RequestDownload(_TransferRequestService):
+    """RequestDownload service (0x34)."""
     
-    SERVICE_ID = SERVICE_REQUEST_UPLOAD
+    SERVICE_ID = SERVICE_REQUEST_DOWNLOAD
     
-    @dataclass
+    @_slotted
+    @dataclass(frozen=True)
     class ServiceData:
         """Parsed service data from response."""
         memory_address_echo: int
         memory_size_echo: int
         max_number_of_block_length: Optional[int] = None
+
+
+class RequestUpload(_TransferRequestService):
+    """RequestUpload service (0x35)."""
     
-    @classmethod
-    def make_request(
-        cls,
-        memory_address: int,
-        memory_size: int,
-        compression_method: Optional[int] = None,
-        encryption_method: Optional[int] = None
-    ) -> Request:
-        """
-        Create a RequestUpload request.
-        
-        Args:
-            memory_address: Memory address (24-bit, 3 bytes)
-            memory_size: Memory size (24-bit, 3 bytes)
-            compression_method: Optional compression method (1 byte)
-            encryption_method: Optional encryption method (1 byte)
-            
-        Returns:
-            Request object
-        """
-        # Extract address bytes (High, Middle, Low)
-        memory_address_high = (memory_address >> 16) & 0xFF
-        memory_address_middle = (memory_address >> 8) & 0xFF
-        memory_address_low = memory_address & 0xFF
-        
-        # Extract size bytes (High, Middle, Low)
-        memory_size_high = (memory_size >> 16) & 0xFF
-        memory_size_middle = (memory_size >> 8) & 0xFF
-        memory_size_low = memory_size & 0xFF
-        
-        data = bytes([
-            memory_address_high,
-            memory_address_middle,
-            memory_address_low,
-            memory_size_high,
-            memory_size_middle,
-            memory_size_low
-        ])
-        
-        if compression_method is not None:
-            data += bytes([compression_method])
-        if encryption_method is not None:
-            data += bytes([encryption_method])
-        
-        return Request(cls.SERVICE_ID, data)
+    SERVICE_ID = SERVICE_REQUEST_UPLOAD
     
-    @classmethod
-    def interpret_response(cls, response: Response) -> 'RequestUpload.ServiceData':
-        """
-        Interpret a RequestUpload response.
-        
-        Args:
-            response: Response object
-            
-        Returns:
-            ServiceData with parsed response data
-            
-        Raises:
-            ValueError: If response data is invalid
-        """
-        if not response.is_positive():
-            raise ValueError("Response is not positive")
-        
-        if len(response.data) < 6:
-            raise ValueError("Invalid response data length: must be at least 6 bytes")
-        
-        # Parse memory address echo
-        memory_address_high = response.data[0]
-        memory_address_middle = response.data[1]
-        memory_address_low = response.data[2]
-        memory_address_echo = (memory_address_high << 16) | (memory_address_middle << 8) | memory_address_low
-        
-        # Parse memory size echo
-        memory_size_high = response.data[3]
-        memory_size_middle = response.data[4]
-        memory_size_low = response.data[5]
-        memory_size_echo = (memory_size_high << 16) | (memory_size_middle << 8) | memory_size_low
-        
-        max_number_of_block_length = None
-        if len(response.data) >= 7:
-            max_number_of_block_length = response.data[6]
-        
-        return cls.ServiceData(
-            memory_address_echo=memory_address_echo,
-            memory_size_echo=memory_size_echo,
-            max_number_of_block_length=max_number_of_block_length
-        )
+    @_slotted
+    @dataclass(frozen=True)
+    class ServiceData:
+        """Parsed service data from response."""
+        memory_address_echo: int
+        memory_size_echo: int
+        max_number_of_block_length: Optional[int] = None
 
 
 class TransferData(ServiceBase):
@@ -2066,11 +2149,12 @@ class TransferData(ServiceBase):
     
     SERVICE_ID = SERVICE_TRANSFER_DATA
     
-    @dataclass
+    @_slotted
+    @dataclass(frozen=True)
     class ServiceData:
         """Parsed service data from response."""
         block_sequence_number_echo: int
-        transfer_response_parameter_record: Optional[bytes] = None
+        transfer_response_parameter_record: Optional[Union[bytes, memoryview]] = None
     
     @classmethod
     def make_request(
@@ -2088,16 +2172,72 @@ class TransferData(ServiceBase):
         Returns:
             Request object
         """
-        data = bytes([block_sequence_number]) + transfer_request_parameter_record
+        data = _u8(block_sequence_number) + transfer_request_parameter_record
         return Request(cls.SERVICE_ID, data)
     
     @classmethod
-    def interpret_response(cls, response: Response) -> 'TransferData.ServiceData':
+    def make_request_batch(
+        cls,
+        first_block_sequence_number: int,
+        payload: bytes,
+        block_size: int
+    ) -> Iterator[Request]:
+        """
+        Create TransferData requests for a whole payload, one per block.
+        
+        The payload is sliced through a memoryview, so each block is copied
+        only once, directly into its request. The block sequence number
+        wraps from 0xFF to 0x00. The last block may be shorter than
+        block_size.
+        
+        Args:
+            first_block_sequence_number: Sequence number of the first block
+            payload: Data to transfer
+            block_size: Number of payload bytes per request
+            
+        Returns:
+            Iterator of Request objects in transfer order
+            
+        Raises:
+            ValueError: If block_size is not positive or the first sequence
+                number is outside 0..255. Raised by this call itself, before
+                any request is produced.
+        """
+        if block_size < 1:
+            raise ValueError(f"Invalid block size: {block_size}")
+        if not 0 <= first_block_sequence_number <= 0xFF:
+            raise ValueError(f"Invalid block sequence number: {first_block_sequence_number}")
+        
+        return cls._iter_blocks(first_block_sequence_number, memoryview(payload), block_size)
+    
+    @classmethod
+    def _iter_blocks(
+        cls,
+        sequence_number: int,
+        view: memoryview,
+        block_size: int
+    ) -> Iterator[Request]:
+        """Yield the already-validated blocks for make_request_batch."""
+        for offset in range(0, len(view), block_size):
+            yield Request(
+                cls.SERVICE_ID,
+                _ONEBYTE[sequence_number & 0xFF] + view[offset:offset + block_size]
+            )
+            sequence_number += 1
+    
+    @classmethod
+    def interpret_response(
+        cls,
+        response: Response,
+        zero_copy: bool = False
+    ) -> 'TransferData.ServiceData':
         """
         Interpret a TransferData response.
         
         Args:
             response: Response object
+            zero_copy: If True, return the parameter record as a memoryview into the
+                response buffer instead of copying it into a new bytes object
             
         Returns:
             ServiceData with parsed response data
@@ -2105,14 +2245,17 @@ class TransferData(ServiceBase):
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         if len(response.data) < 1:
             raise ValueError("Invalid response data length: must be at least 1 byte")
         
         block_sequence_number_echo = response.data[0]
-        transfer_response_parameter_record = response.data[1:] if len(response.data) > 1 else None
+        if zero_copy:
+            transfer_response_parameter_record = memoryview(response.data)[1:] or None
+        else:
+            transfer_response_parameter_record = response.data[1:] or None
         
         return cls.ServiceData(
             block_sequence_number_echo=block_sequence_number_echo,
@@ -2125,7 +2268,8 @@ class RequestTransferExit(ServiceBase):
     
     SERVICE_ID = SERVICE_REQUEST_TRANSFER_EXIT
     
-    @dataclass
+    @_slotted
+    @dataclass(frozen=True)
     class ServiceData:
         """Parsed service data from response."""
         transfer_response_parameter_record: Optional[bytes] = None
@@ -2144,8 +2288,7 @@ class RequestTransferExit(ServiceBase):
         Returns:
             Request object
         """
-        data = transfer_request_parameter_record if transfer_request_parameter_record else b''
-        return Request(cls.SERVICE_ID, data)
+        return Request(cls.SERVICE_ID, transfer_request_parameter_record or b'')
     
     @classmethod
     def interpret_response(cls, response: Response) -> 'RequestTransferExit.ServiceData':
@@ -2158,10 +2301,10 @@ class RequestTransferExit(ServiceBase):
         Returns:
             ServiceData with parsed response data
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
-        transfer_response_parameter_record = response.data if len(response.data) > 0 else None
+        transfer_response_parameter_record = response.data or None
         
         return cls.ServiceData(
             transfer_response_parameter_record=transfer_response_parameter_record
@@ -2182,7 +2325,8 @@ class SecurityAccess(ServiceBase):
         REQUEST_SEED = 0x01  # Request seed
         SEND_KEY = 0x02  # Send key
     
-    @dataclass
+    @_slotted
+    @dataclass(frozen=True)
     class ServiceData:
         """Parsed service data from response."""
         access_type_echo: int
@@ -2204,7 +2348,7 @@ class SecurityAccess(ServiceBase):
         Returns:
             Request object
         """
-        data = bytes([access_type])
+        data = _u8(access_type)
         if security_access_data:
             data += security_access_data
         return Request(cls.SERVICE_ID, data)
@@ -2223,14 +2367,14 @@ class SecurityAccess(ServiceBase):
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         if len(response.data) < 1:
             raise ValueError("Invalid response data length: must be at least 1 byte")
         
         access_type_echo = response.data[0]
-        security_access_data = response.data[1:] if len(response.data) > 1 else None
+        security_access_data = response.data[1:] or None
         
         return cls.ServiceData(
             access_type_echo=access_type_echo,
@@ -2247,7 +2391,8 @@ class ReadEcuIdentification(ServiceBase):
     
     SERVICE_ID = SERVICE_READ_ECU_IDENTIFICATION
     
-    @dataclass
+    @_slotted
+    @dataclass(frozen=True)
     class ServiceData:
         """Parsed service data from response."""
         ecu_identification_data: bytes
@@ -2263,8 +2408,9 @@ class ReadEcuIdentification(ServiceBase):
         Returns:
             Request object
         """
-        data = bytes([ecu_identification_option]) if ecu_identification_option is not None else b''
-        return Request(cls.SERVICE_ID, data)
+        if ecu_identification_option is None:
+            return Request(cls.SERVICE_ID, b'')
+        return Request(cls.SERVICE_ID, _u8(ecu_identification_option))
     
     @classmethod
     def interpret_response(cls, response: Response) -> 'ReadEcuIdentification.ServiceData':
@@ -2277,7 +2423,7 @@ class ReadEcuIdentification(ServiceBase):
         Returns:
             ServiceData with parsed response data
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         return cls.ServiceData(ecu_identification_data=response.data[1:])
@@ -2294,7 +2440,8 @@ class DynamicallyDefineLocalIdentifier(ServiceBase):
         DEFINE_BY_MEMORY_ADDRESS = 0x02
         CLEAR_DYNAMICALLY_DEFINED_LOCAL_IDENTIFIER = 0x03
     
-    @dataclass
+    @_slotted
+    @dataclass(frozen=True)
     class ServiceData:
         """Parsed service data from response."""
         sub_function_echo: int
@@ -2315,7 +2462,7 @@ class DynamicallyDefineLocalIdentifier(ServiceBase):
         Returns:
             Request object
         """
-        data = bytes([sub_function]) + definition_record
+        data = _u8(sub_function) + definition_record
         return Request(cls.SERVICE_ID, data)
     
     @classmethod
@@ -2332,7 +2479,7 @@ class DynamicallyDefineLocalIdentifier(ServiceBase):
         Raises:
             ValueError: If response data is invalid
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
         if len(response.data) < 1:
@@ -2347,6 +2494,32 @@ class EscCode(ServiceBase):
     SERVICE_ID = SERVICE_ESC_CODE
     POSITIVE_RESPONSE_SERVICE_ID = 0xC0  # EscCodePositiveResponse
     
+    @_slotted
+    @dataclass(frozen=True)
+    class ServiceData:
+        """
+        Parsed service data from response.
+        
+        Also supports the read-only dict access of the former dict result:
+        'data' is only present as a key when the response carried data.
+        """
+        data: Optional[bytes] = None
+        
+        def __getitem__(self, key: str) -> bytes:
+            if key != 'data' or self.data is None:
+                raise KeyError(key)
+            return self.data
+        
+        def __contains__(self, key: str) -> bool:
+            return key == 'data' and self.data is not None
+        
+        def __len__(self) -> int:
+            return 0 if self.data is None else 1
+        
+        def get(self, key: str, default=None):
+            """Return the value for key, like dict.get."""
+            return self[key] if key in self else default
+    
     @classmethod
     def make_request(cls, esc_code_data: Optional[bytes] = None) -> Request:
         """
@@ -2362,7 +2535,7 @@ class EscCode(ServiceBase):
         return Request(cls.SERVICE_ID, data)
     
     @classmethod
-    def interpret_response(cls, response: Response) -> dict:
+    def interpret_response(cls, response: Response) -> 'EscCode.ServiceData':
         """
         Interpret an EscCode response.
         
@@ -2370,14 +2543,10 @@ class EscCode(ServiceBase):
             response: Response object
             
         Returns:
-            Dictionary with parsed response data
+            ServiceData with parsed response data
         """
-        if not response.is_positive():
+        if not response.positive:
             raise ValueError("Response is not positive")
         
-        result = {}
-        if len(response.data) > 0:
-            result['data'] = response.data
-        
-        return result
+        return cls.ServiceData(data=response.data or None)
 
@@ -1,6 +1,7 @@
 """Transport layer abstraction for KWP2000."""
 
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import Optional
 
 from .exceptions import TransportException
@@ -13,6 +14,10 @@ class Transport(ABC):
     This provides the raw connection interface for sending and receiving frames.
     """
     
+    # Empty so that subclasses may declare __slots__; subclasses without
+    # their own __slots__ still get a regular __dict__
+    __slots__ = ()
+    
     @abstractmethod
     def send(self, data: bytes) -> None:
         """
@@ -72,7 +77,7 @@ class MockTransport(Transport):
     
     def __init__(self):
         self._sent_frames = []
-        self._response_queue = []
+        self._response_queue = deque()
         self._is_open = False
     
     def open(self) -> None:
@@ -105,7 +110,7 @@ class MockTransport(Transport):
             raise TransportException("Transport not open")
         
         if self._response_queue:
-            return self._response_queue.pop(0)
+            return self._response_queue.popleft()
         return None
     
     def queue_response(self, frame: bytes) -> None:
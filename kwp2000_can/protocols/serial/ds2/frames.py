@@ -71,12 +71,12 @@ def parse_frame(frame: bytes) -> Tuple[int, bytes]:
     # Extract payload (everything between size byte and checksum)
     payload = frame[2:size-1]
     
-    # Verify checksum
-    message = frame[:size-1]  # Everything except checksum
-    expected_checksum = calculate_checksum(message)
-    actual_checksum = frame[size-1]
-    
-    if actual_checksum != expected_checksum:
+    # Verify checksum in a single pass: XOR over the whole frame, checksum
+    # byte included, is zero for a valid frame
+    residue = calculate_checksum(memoryview(frame)[:size])
+    if residue:
+        actual_checksum = frame[size-1]
+        expected_checksum = residue ^ actual_checksum
         raise InvalidChecksumException(
             f"Invalid checksum: expected {expected_checksum:02X}, got {actual_checksum:02X}"
         )
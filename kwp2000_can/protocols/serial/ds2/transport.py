@@ -1,6 +1,7 @@
 """Transport layer abstraction for DS2."""
 
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import Optional
 
 from .exceptions import TransportException
@@ -72,7 +73,7 @@ class MockTransport(Transport):
     
     def __init__(self):
         self._sent_frames = []
-        self._response_queue = []
+        self._response_queue = deque()
         self._is_open = False
     
     def open(self) -> None:
@@ -105,7 +106,7 @@ class MockTransport(Transport):
             raise TransportException("Transport not open")
         
         if self._response_queue:
-            return self._response_queue.pop(0)
+            return self._response_queue.popleft()
         return None
     
     def queue_response(self, frame: bytes) -> None:
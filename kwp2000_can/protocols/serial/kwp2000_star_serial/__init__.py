@@ -10,13 +10,14 @@ from .constants import (
     TARGET_ADDR,
     SRC_ADDR,
 )
-from .frames import build_frame, parse_frame, calculate_checksum
+from .frames import build_frame, build_frame_into, parse_frame, calculate_checksum
 from .transport import KWP2000StarTransport
 
 __version__ = "0.1.0"
 
 __all__ = [
     'build_frame',
+    'build_frame_into',
     'parse_frame',
     'calculate_checksum',
     'START_BYTE',
@@ -53,6 +53,38 @@ def build_frame(payload: bytes) -> bytes:
     return frame
 
 
+def build_frame_into(buffer: bytearray, payload: bytes) -> int:
+    """
+    Build a complete KWP2000-STAR frame in a caller-owned buffer.
+    
+    Same frame as build_frame, written in place so a transport can reuse one
+    buffer for every send instead of allocating a new bytes object.
+    
+    Args:
+        buffer: Writable buffer, at least len(payload) + 5 bytes long
+        payload: Payload bytes
+        
+    Returns:
+        Number of frame bytes written (checksum included)
+        
+    Raises:
+        ValueError: If the payload is longer than 255 bytes
+    """
+    length = len(payload)
+    if length > 0xFF:
+        raise ValueError(f"Payload too long for STAR frame: {length} bytes (max 255)")
+    
+    end = 4 + length
+    buffer[0] = START_BYTE
+    buffer[1] = TARGET_ADDR
+    buffer[2] = SRC_ADDR
+    buffer[3] = length
+    buffer[4:end] = payload
+    buffer[end] = calculate_checksum(memoryview(buffer)[:end])
+    
+    return end + 1
+
+
 def parse_frame(frame: bytes) -> Tuple[bytes]:
     """
     Parse a KWP2000-STAR frame.
@@ -83,8 +115,7 @@ def parse_frame(frame: bytes) -> Tuple[bytes]:
     if frame[2] != SRC_ADDR:
         #raise InvalidFrameException(f"Invalid source address: expected {SRC_ADDR:02X}, got {frame[2]:02X}")
         pass
-    #print(frame.hex())
-
+    
     # Extract length
     length = frame[3]
     
@@ -99,12 +130,12 @@ def parse_frame(frame: bytes) -> Tuple[bytes]:
     # Extract payload
     payload = frame[4:4+length]
     
-    # Verify checksum (everything except checksum itself)
-    message = frame[0:4+length]  # START_BYTE + TARGET_ADDR + SRC_ADDR + len + payload
-    expected_checksum = calculate_checksum(message)
-    actual_checksum = frame[4+length]
-    
-    if actual_checksum != expected_checksum:
+    # Verify checksum in a single pass: XOR over the whole frame, checksum
+    # byte included, is zero for a valid frame
+    residue = calculate_checksum(memoryview(frame)[:expected_frame_length])
+    if residue:
+        actual_checksum = frame[4+length]
+        expected_checksum = residue ^ actual_checksum
         raise InvalidChecksumException(
             f"Invalid checksum: expected {expected_checksum:02X}, got {actual_checksum:02X}"
         )
@@ -8,8 +8,11 @@ from kwp2000_can.interface.serial import ComportTransport
 from kwp2000_can.protocols.kwp2000 import TimingParameters, TIMING_PARAMETER_STANDARD
 from kwp2000_can.protocols.kwp2000 import Transport
 from kwp2000_can.protocols.kwp2000 import TransportException, TimeoutException, NegativeResponseException
+from kwp2000_can.protocols.kwp2000 import KWP2000Exception
+from kwp2000_can.protocols.kwp2000 import services
+from .constants import START_BYTE, TARGET_ADDR, SRC_ADDR
 from .exceptions import InvalidChecksumException, InvalidFrameException
-from .frames import build_frame, parse_frame
+from .frames import build_frame_into, parse_frame
 
 try:
     import serial
@@ -19,6 +22,20 @@ except ImportError:
         "Install it with: pip install pyserial"
     )
 
+_logger = logging.getLogger(__name__)
+
+# Baudrates tried by identify_baudrate, in order of common usage
+_DEFAULT_BAUDRATES = (
+    10400,   # 10.4 kbps (common for older ECUs)
+    9600,    # 9.6 kbps (very common)
+    19200,   # 19.2 kbps
+    20800,   # 20.8 kbps
+    38400,   # 38.4 kbps
+    57600,   # 57.6 kbps
+    115200,  # 115.2 kbps
+    125000,  # 125 kbps (high speed)
+)
+
 
 class KWP2000StarTransport(Transport):
     """
@@ -39,6 +56,12 @@ class KWP2000StarTransport(Transport):
             response = client.startDiagnosticSession(session_type=0x81)
     """
     
+    __slots__ = (
+        'logger', '_access_timings', '_wait_timeout', '_p3min_seconds',
+        '_comport_transport', '_is_open', '_last_receive_time', '_tx_buf',
+        '_last_baudrate',
+    )
+    
     def __init__(
         self,
         port: str,
@@ -47,7 +70,8 @@ class KWP2000StarTransport(Transport):
         bytesize: int = serial.EIGHTBITS,
         parity: str = serial.PARITY_EVEN,
         stopbits: float = serial.STOPBITS_TWO,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        low_latency: bool = True
     ):
         """
         Initialize KWP2000-STAR transport.
@@ -60,8 +84,10 @@ class KWP2000StarTransport(Transport):
             parity: Parity setting (default: NONE)
             stopbits: Number of stop bits (default: 1)
             logger: Optional logger instance (default: root logger)
+            low_latency: Request the serial driver's low-latency mode while open
+                (default: True); short STAR frames are latency-bound
         """
-        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.logger = logger if logger is not None else _logger
         
         # Access timing parameters (used to set wait_frame timeout)
         self.access_timings: TimingParameters = TIMING_PARAMETER_STANDARD
@@ -74,13 +100,20 @@ class KWP2000StarTransport(Transport):
             bytesize=bytesize,
             parity=parity,
             stopbits=stopbits,
-            logger=self.logger
+            logger=self.logger,
+            low_latency=low_latency
         )
         
         self._is_open = False
         
         # Track last receive time for p3min timing enforcement
         self._last_receive_time: Optional[float] = None
+        
+        # Reused for every outgoing frame: 4 header bytes + 255 payload + checksum
+        self._tx_buf = bytearray(260)
+        
+        # Last baudrate found by identify_baudrate, probed first next time
+        self._last_baudrate: Optional[int] = None
     
     def open(self) -> None:
         """Open the transport connection."""
@@ -122,8 +155,7 @@ class KWP2000StarTransport(Transport):
         try:
             # Enforce p3min timing: wait if not enough time has passed since last receive
             if self._last_receive_time is not None:
-                # p3min is in 0.5 ms units, convert to seconds
-                p3min_seconds = (self.access_timings.p3min * 0.5) / 1000.0
+                p3min_seconds = self._p3min_seconds
                 elapsed = time.time() - self._last_receive_time
                 
                 if elapsed < p3min_seconds:
@@ -131,10 +163,11 @@ class KWP2000StarTransport(Transport):
                     self.logger.debug(f"Waiting {wait_time*1000:.1f}ms for p3min timing")
                     time.sleep(wait_time)
             
-            # Build STAR frame from payload
-            star_frame = build_frame(data)
-            self.logger.debug(f"Sending STAR frame: {star_frame.hex()}")
-
+            # Build STAR frame from payload in the reusable TX buffer
+            frame_len = build_frame_into(self._tx_buf, data)
+            star_frame = memoryview(self._tx_buf)[:frame_len]
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Sending STAR frame: {star_frame.hex()}")
             
             # Send frame through COM port transport
             self._comport_transport.send(star_frame)
@@ -164,30 +197,21 @@ class KWP2000StarTransport(Transport):
             raise TransportException("Transport not open")
         
         try:
-            # Calculate timeout from access_timings.p2max
-            # P2max uses 25 ms resolution, convert to seconds
-            calculated_timeout = (self.access_timings.p2max * 25.0) / 1000.0
-            
-            # Import constants for validation
-            from .constants import START_BYTE, TARGET_ADDR, SRC_ADDR
+            # Timeout derived from access_timings.p2max (see access_timings)
+            calculated_timeout = self._wait_timeout
+            wait_frame = self._comport_transport.wait_frame
             
-            # Step 1: Receive first 3 bytes [START_BYTE, TARGET_ADDR, SRC_ADDR]
-            header = self._comport_transport.wait_frame(timeout=calculated_timeout, max_bytes=3)
+            # Step 1: Receive the 4 header bytes [START_BYTE, TARGET_ADDR, SRC_ADDR, length],
+            # skipping any garbage in front of the start byte
+            header = self._read_aligned_header(calculated_timeout)
             
-            if header is None or len(header) != 3:
+            if header is None:
                 return None
             
-            # Step 2: Validate first 3 bytes
-            start_byte = header[0]
+            # Step 2: Validate address bytes
             target_addr = header[1]
             src_addr = header[2]
             
-            # Validate start byte
-            if start_byte != START_BYTE:
-                raise TransportException(
-                    f"Invalid start byte: expected 0x{START_BYTE:02X}, got 0x{start_byte:02X}"
-                )
-            
             # Validate target address (optional check, as parse_frame may allow different values)
             # Note: parse_frame currently doesn't raise on mismatch, but we can still validate
             if target_addr != TARGET_ADDR:
@@ -201,30 +225,26 @@ class KWP2000StarTransport(Transport):
                     f"Source address mismatch: expected 0x{SRC_ADDR:02X}, got 0x{src_addr:02X}"
                 )
             
-            # Step 3: Read length byte (4th byte)
-            length_byte_data = self._comport_transport.wait_frame(timeout=calculated_timeout, max_bytes=1)
-            
-            if length_byte_data is None or len(length_byte_data) != 1:
-                return None
+            payload_length = header[3]
             
-            payload_length = length_byte_data[0]
-            
-            # Step 4: Receive the rest based on length (payload + checksum)
+            # Step 3: Receive the rest based on length (payload + checksum) in one read
             remaining_bytes = payload_length + 1  # payload + checksum
-            remaining_data = self._comport_transport.wait_frame(timeout=calculated_timeout, max_bytes=remaining_bytes)
+            remaining_data = wait_frame(timeout=calculated_timeout, max_bytes=remaining_bytes)
             
             if remaining_data is None or len(remaining_data) != remaining_bytes:
                 return None
             
-            # Step 5: Combine header, length, and remaining data, then parse
-            star_frame = header + length_byte_data + remaining_data
+            # Step 4: Combine header and remaining data, then parse
+            star_frame = header + remaining_data
             
-            self.logger.debug(f"Received STAR frame: {star_frame.hex()}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Received STAR frame: {star_frame.hex()}")
             
             # Parse STAR frame to extract payload
             try:
                 payload, = parse_frame(star_frame)
-                self.logger.debug(f"Parsed payload: {payload.hex()}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Parsed payload: {payload.hex()}")
                 
                 # Record receive time for p3min timing enforcement
                 self._last_receive_time = time.time()
@@ -238,6 +258,50 @@ class KWP2000StarTransport(Transport):
         except Exception as e:
             raise TransportException(f"Failed to receive STAR frame: {e}") from e
     
+    def _read_aligned_header(self, timeout: float, max_skip: int = 256) -> Optional[bytes]:
+        """
+        Read the 4 STAR header bytes, discarding any bytes before START_BYTE.
+        
+        Stale bytes from a previous baudrate (UART framing errors) or line noise
+        would otherwise fail the start byte check and lose the whole response.
+        The header is read in one call; only when it is misaligned are the
+        missing bytes read after the first START_BYTE found.
+        
+        Args:
+            timeout: Timeout in seconds for each read
+            max_skip: Maximum number of bytes to discard before giving up
+            
+        Returns:
+            The 4 header bytes starting with START_BYTE, or None if timeout occurs
+            
+        Raises:
+            TransportException: If no START_BYTE is found within max_skip bytes
+        """
+        wait_frame = self._comport_transport.wait_frame
+        header = wait_frame(timeout=timeout, max_bytes=4)
+        skipped = 0
+        
+        while header is not None and len(header) == 4 and header[0] != START_BYTE:
+            start = header.find(START_BYTE)
+            if start < 0:
+                start = 4
+            skipped += start
+            if skipped > max_skip:
+                raise TransportException(
+                    f"Invalid start byte: no 0x{START_BYTE:02X} within {max_skip} bytes"
+                )
+            rest = wait_frame(timeout=timeout, max_bytes=start)
+            if rest is None:
+                return None
+            header = header[start:] + rest
+        
+        if header is None or len(header) != 4:
+            return None
+        
+        if skipped:
+            self.logger.debug(f"Skipped {skipped} bytes before STAR start byte")
+        return header
+    
     def set_baudrate(self, baudrate: int) -> None:
         """
         Change the baudrate of the underlying COM port connection.
@@ -257,6 +321,19 @@ class KWP2000StarTransport(Transport):
         self._comport_transport.set_baudrate(baudrate)
         self.logger.info(f"Changed KWP2000-STAR transport baudrate to {baudrate}")
     
+    @property
+    def access_timings(self) -> TimingParameters:
+        """Access timing parameters (used to set wait_frame timeout and p3min spacing)."""
+        return self._access_timings
+    
+    @access_timings.setter
+    def access_timings(self, timing_parameters: TimingParameters) -> None:
+        self._access_timings = timing_parameters
+        # Derived once here rather than on every frame:
+        # P2max uses 25 ms resolution, p3min 0.5 ms units; convert to seconds
+        self._wait_timeout = (timing_parameters.p2max * 25.0) / 1000.0
+        self._p3min_seconds = (timing_parameters.p3min * 0.5) / 1000.0
+    
     def set_access_timings(self, timing_parameters: TimingParameters) -> None:
         """
         Set the access timing parameters used for wait_frame timeout calculation.
@@ -288,6 +365,7 @@ class KWP2000StarTransport(Transport):
         
         This method loops through available KWP2000 baudrates, sends TesterPresent
         messages at each baudrate, and returns the first baudrate that receives a response.
+        The baudrate found by the previous call, if any, is tried first.
         
         Args:
             client: KWP2000Client instance to use for sending TesterPresent messages
@@ -304,24 +382,23 @@ class KWP2000StarTransport(Transport):
         if not self._is_open:
             raise TransportException("Transport not open")
         
-        # Default baudrates to test (in order of common usage)
-        if baudrates is None:
-            baudrates = [
-                10400,   # 10.4 kbps (common for older ECUs)
-                9600,    # 9.6 kbps (very common)
-                19200,   # 19.2 kbps
-                20800,   # 20.8 kbps
-                38400,   # 38.4 kbps
-                57600,   # 57.6 kbps
-                115200,  # 115.2 kbps
-                125000,  # 125 kbps (high speed)
-            ]
+        baudrates = list(_DEFAULT_BAUDRATES) if baudrates is None else list(baudrates)
+        
+        # An ECU usually answers at the same rate as last time; try that first
+        last_baudrate = self._last_baudrate
+        if last_baudrate in baudrates:
+            baudrates.remove(last_baudrate)
+            baudrates.insert(0, last_baudrate)
         
         if verbose:
             self.logger.info(f"Starting baudrate identification, testing {len(baudrates)} baudrates...")
         
+        response_required = services.TesterPresent.ResponseRequired.YES
+        
+        serial_port = self._comport_transport._serial
+        
         # Store original baudrate to restore later if no working baudrate is found
-        original_baudrate = self._comport_transport._serial.baudrate
+        original_baudrate = serial_port.baudrate
         found_baudrate = None
         
         try:
@@ -333,18 +410,18 @@ class KWP2000StarTransport(Transport):
                     # Change to current baudrate
                     self.set_baudrate(baudrate)
                     
-                    # Small delay to let the baudrate change settle
-                    time.sleep(0.05)
+                    # Drain pending output, then wait roughly one character time
+                    # (11 bits) at the new rate for the line to settle
+                    serial_port.flush()
+                    time.sleep(max(0.002, 11.0 / baudrate))
                     
                     # Clear any pending data in the input buffer
-                    if self._comport_transport._serial:
-                        self._comport_transport._serial.reset_input_buffer()
+                    serial_port.reset_input_buffer()
                     
                     # Send TesterPresent request with response required
                     try:
-                        from ...kwp2000 import services
                         response = client.tester_present(
-                            response_required=services.TesterPresent.ResponseRequired.YES,
+                            response_required=response_required,
                             timeout=timeout
                         )
                         
@@ -353,7 +430,7 @@ class KWP2000StarTransport(Transport):
                             self.logger.info(f"Response received at {baudrate} baud")
                         found_baudrate = baudrate
                         time.sleep(0.05)
-                        self._comport_transport._serial.reset_input_buffer()
+                        serial_port.reset_input_buffer()
                         break  # Found working baudrate, exit loop
                         
                     except TimeoutException:
@@ -370,28 +447,26 @@ class KWP2000StarTransport(Transport):
                         found_baudrate = baudrate
                         break  # Found working baudrate, exit loop
                         
-                    except Exception as e:
-                        # Other errors - log but continue
+                    except (KWP2000Exception, ValueError) as e:
+                        # Garbled or unexpected response at the wrong rate - continue
                         if verbose:
                             self.logger.debug(f"Error at {baudrate} baud: {type(e).__name__}")
                         continue
                         
-                except TransportException as e:
+                except (TransportException, serial.SerialException) as e:
                     if verbose:
                         self.logger.warning(f"Transport error at {baudrate} baud: {e}")
                     continue
-                except Exception as e:
-                    if verbose:
-                        self.logger.warning(f"Unexpected error at {baudrate} baud: {type(e).__name__}: {e}")
-                    continue
             
             # Return found baudrate (or None if none found)
-            if found_baudrate is None:
+            if found_baudrate is not None:
+                self._last_baudrate = found_baudrate
+            else:
                 if verbose:
                     self.logger.warning("No working baudrate found")
                 # Restore original baudrate if no working baudrate was found
                 try:
-                    if self._comport_transport._serial.baudrate != original_baudrate:
+                    if serial_port.baudrate != original_baudrate:
                         self.set_baudrate(original_baudrate)
                 except Exception:
                     pass
@@ -401,7 +476,7 @@ class KWP2000StarTransport(Transport):
         except Exception as e:
             # On any unexpected error, try to restore original baudrate
             try:
-                if self._comport_transport._serial.baudrate != original_baudrate:
+                if serial_port.baudrate != original_baudrate:
                     self.set_baudrate(original_baudrate)
             except Exception:
                 pass
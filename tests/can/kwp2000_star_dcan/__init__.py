@@ -0,0 +1,2 @@
+"""Tests for the KWP2000-STAR DCAN adapter."""
+
@@ -0,0 +1,156 @@
+"""
+Pytest tests for the KWP2000-STAR DCAN adapter.
+Tests telegram framing and checksums on the send and receive paths.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure project root is at the beginning of sys.path (highest priority)
+project_root_str = str(Path(__file__).parent.parent.parent.parent.resolve())
+if project_root_str in sys.path:
+    sys.path.remove(project_root_str)
+sys.path.insert(0, project_root_str)
+
+# Import from project root packages
+from kwp2000_can.protocols.can.kwp200_star_dcan.transport import Kwp2000StarDcan
+from tests.serial.mockup_comport import MockupComport
+
+TARGET = 0x12
+SOURCE = 0xF1
+
+
+def _checksum(frame: bytes) -> int:
+    """Reference checksum: sum of all bytes modulo 256."""
+    return sum(frame) & 0xFF
+
+
+def _make_adapter(zero_copy: bool = False):
+    """Create an open adapter wired to a mock COM port."""
+    adapter = Kwp2000StarDcan(port='COM1', target=TARGET, source=SOURCE, zero_copy=zero_copy)
+    mock_comport = MockupComport()
+    adapter._comport_transport = mock_comport
+    adapter.open()
+    return adapter, mock_comport
+
+
+def test_send_short_format():
+    """Payloads up to 0x3F bytes use [0x80 | length, target, source, payload, checksum]."""
+    adapter, mock_comport = _make_adapter()
+    
+    adapter.send(b'\x1a\x86')
+    
+    header_and_payload = bytes([0x82, TARGET, SOURCE, 0x1A, 0x86])
+    assert mock_comport.get_sent_frames() == [header_and_payload + bytes([_checksum(header_and_payload)])]
+
+
+def test_send_long_format():
+    """Longer payloads use [0x80, target, source, length, payload, checksum]."""
+    adapter, mock_comport = _make_adapter()
+    payload = bytes(range(0x40, 0x40 + 100))
+    
+    adapter.send(payload)
+    
+    header_and_payload = bytes([0x80, TARGET, SOURCE, len(payload)]) + payload
+    assert mock_comport.get_sent_frames() == [header_and_payload + bytes([_checksum(header_and_payload)])]
+
+
+def test_send_reuses_buffer_without_leaking_previous_frame():
+    """A shorter telegram after a longer one carries only its own bytes."""
+    adapter, mock_comport = _make_adapter()
+    
+    adapter.send(bytes(200))
+    adapter.send(bytearray(b'\x3e'))
+    adapter.send(memoryview(b'\x10\x89'))
+    
+    frames = mock_comport.get_sent_frames()
+    assert [len(frame) for frame in frames] == [205, 5, 6]
+    assert all(frame[-1] == _checksum(frame[:-1]) for frame in frames)
+
+
+def test_send_checksum_follows_reassigned_addresses():
+    """Changing target/source after construction is reflected in header and checksum."""
+    adapter, mock_comport = _make_adapter()
+    adapter.target = 0x40
+    
+    adapter.send(b'\x3e\x01')
+    
+    frame = mock_comport.get_sent_frames()[0]
+    assert frame[1] == 0x40
+    assert frame[-1] == _checksum(frame[:-1])
+
+
+def test_send_rejects_oversized_payload():
+    """Payloads longer than the 1-byte length field are rejected."""
+    adapter, mock_comport = _make_adapter()
+    
+    with pytest.raises(ValueError):
+        adapter.send(bytes(256))
+    assert mock_comport.get_sent_frames() == []
+
+
+def _response_frame(payload: bytes, long_format: bool = False) -> bytes:
+    """Build an ECU response telegram [.., source, target, ..., checksum]."""
+    if long_format:
+        header = bytes([0x80, SOURCE, TARGET, len(payload)])
+    else:
+        header = bytes([0x80 | len(payload), SOURCE, TARGET])
+    frame = header + payload
+    return frame + bytes([_checksum(frame)])
+
+
+@pytest.mark.parametrize('long_format', [False, True])
+def test_wait_frame_returns_payload(long_format):
+    """Short and long response telegrams are unwrapped to their payload."""
+    adapter, mock_comport = _make_adapter()
+    payload = bytes(range(1, 80)) if long_format else b'\x5a\x86\x01'
+    mock_comport.queue_bytes(_response_frame(payload, long_format))
+    
+    result = adapter.wait_frame(timeout=0.1)
+    
+    assert isinstance(result, bytes)
+    assert result == payload
+
+
+def test_wait_frame_results_survive_buffer_reuse():
+    """Without zero_copy, earlier results are not overwritten by later receives."""
+    adapter, mock_comport = _make_adapter()
+    mock_comport.queue_bytes(_response_frame(b'\x61\x01\xaa'))
+    mock_comport.queue_bytes(_response_frame(b'\x61\x02\xbb'))
+    
+    first = adapter.wait_frame(timeout=0.1)
+    second = adapter.wait_frame(timeout=0.1)
+    
+    assert first == b'\x61\x01\xaa'
+    assert second == b'\x61\x02\xbb'
+
+
+def test_wait_frame_zero_copy_view():
+    """With zero_copy, the payload is a view into the receive buffer."""
+    adapter, mock_comport = _make_adapter(zero_copy=True)
+    mock_comport.queue_bytes(_response_frame(b'\x61\x01\xaa'))
+    
+    result = adapter.wait_frame(timeout=0.1)
+    
+    assert isinstance(result, memoryview)
+    assert bytes(result) == b'\x61\x01\xaa'
+
+
+def test_wait_frame_rejects_bad_checksum():
+    """A corrupted checksum byte is rejected."""
+    adapter, mock_comport = _make_adapter()
+    frame = bytearray(_response_frame(b'\x61\x01\xaa'))
+    frame[-1] ^= 0x01
+    mock_comport.queue_bytes(bytes(frame))
+    
+    with pytest.raises(ValueError):
+        adapter.wait_frame(timeout=0.1)
+
+
+def test_wait_frame_timeout():
+    """No data before the timeout raises TimeoutError."""
+    adapter, mock_comport = _make_adapter()
+    
+    with pytest.raises(TimeoutError):
+        adapter.wait_frame(timeout=0.1)
@@ -6,7 +6,7 @@ import sys
 from pathlib import Path
 
 # Calculate paths
-project_root = Path(__file__).parent.parent.parent.parent.resolve()
+project_root = Path(__file__).parent.parent.parent.parent.parent.resolve()
 test_dir = Path(__file__).parent.parent.parent.resolve()
 
 # Remove any conflicting paths that might interfere with imports
@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Optional
 
 # Add parent directories to path to allow imports
-project_root = Path(__file__).parent.parent.parent
+project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from kwp2000_can.protocols.can.tp20 import TP20Transport
@@ -0,0 +1,157 @@
+"""
+Pytest tests for KWP2000 service request builders and response parsers.
+Uses the MockTransport shipped with the kwp2000 package.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure project root is at the beginning of sys.path (highest priority)
+project_root_str = str(Path(__file__).parent.parent.parent.parent.resolve())
+if project_root_str in sys.path:
+    sys.path.remove(project_root_str)
+sys.path.insert(0, project_root_str)
+
+# Import from project root packages
+from kwp2000_can.protocols.kwp2000 import services
+from kwp2000_can.protocols.kwp2000.response import Response
+from kwp2000_can.protocols.kwp2000.transport import MockTransport
+from kwp2000_can.protocols.kwp2000.client import KWP2000Client
+from kwp2000_can.protocols.kwp2000.constants import (
+    SERVICE_READ_DATA_BY_COMMON_IDENTIFIER,
+    RESPONSE_POSITIVE
+)
+
+
+def test_read_data_by_common_identifier_echo():
+    """The 2-byte common identifier echo is parsed and stripped from the record."""
+    transport = MockTransport()
+    client = KWP2000Client(transport)
+    
+    with client:
+        record = bytes([0xAA, 0xBB, 0xCC])
+        transport.queue_response(
+            bytes([RESPONSE_POSITIVE + SERVICE_READ_DATA_BY_COMMON_IDENTIFIER, 0x12, 0x34]) + record
+        )
+        
+        result = client.read_data_by_common_identifier(common_identifier=0x1234)
+        
+        assert transport.get_sent_frames() == [bytes([SERVICE_READ_DATA_BY_COMMON_IDENTIFIER, 0x12, 0x34])]
+        assert result.common_identifier_echo == 0x1234
+        assert result.data == record
+
+
+def test_read_data_by_common_identifier_short_echo():
+    """A response too short for the 2-byte echo is rejected."""
+    response = Response.from_payload(
+        bytes([RESPONSE_POSITIVE + SERVICE_READ_DATA_BY_COMMON_IDENTIFIER, 0x12])
+    )
+    with pytest.raises(ValueError):
+        services.ReadDataByCommonIdentifier.interpret_response(response)
+
+
+def test_read_data_by_common_identifier_out_of_range():
+    """Identifiers that do not fit in 2 bytes are not truncated."""
+    with pytest.raises(OverflowError):
+        services.ReadDataByCommonIdentifier.make_request(common_identifier=0x10000)
+
+
+
+@pytest.mark.parametrize('make_request, exception', [
+    (lambda: services.ReadMemoryByAddress.make_request(0x1000000, 0x10), OverflowError),
+    (lambda: services.ReadMemoryByAddress.make_request(0x123456, 0x100), ValueError),
+    (lambda: services.ReadMemoryByAddress2.make_request(0x123456, 0x100, 0x10), ValueError),
+    (lambda: services.ReadMemoryByAddress2.make_request(0x123456, 0x01, -1), ValueError),
+    (lambda: services.WriteMemoryByAddress.make_request(0x123456, 0x100, b'\x00'), ValueError),
+])
+def test_memory_by_address_out_of_range(make_request, exception):
+    """Out-of-range addresses, sizes and memory types raise instead of being truncated."""
+    with pytest.raises(exception):
+        make_request()
+
+
+def test_memory_by_address_request_layout():
+    """Address, memory type and size bytes are laid out big-endian after the service ID."""
+    request = services.ReadMemoryByAddress2.make_request(0x123456, 0x01, 0x10)
+    assert request.get_data()[1:] == bytes([0x12, 0x34, 0x56, 0x01, 0x10])
+    
+    request = services.WriteMemoryByAddress.make_request(0x123456, 0x02, b'\xAA\xBB')
+    assert request.get_data()[1:] == bytes([0x12, 0x34, 0x56, 0x02, 0xAA, 0xBB])
+
+
+@pytest.mark.parametrize('compression_method, encryption_method, method_bytes', [
+    (None, None, b''),
+    (0x11, None, b'\x11'),
+    (None, 0x22, b'\x22'),
+    (0x11, 0x22, b'\x11\x22'),
+])
+def test_transfer_request_layout(compression_method, encryption_method, method_bytes):
+    """RequestDownload packs address, size and any method bytes in protocol order."""
+    request = services.RequestDownload.make_request(
+        0x123456, 0xABCDEF,
+        compression_method=compression_method,
+        encryption_method=encryption_method
+    )
+    assert request.get_data() == (
+        bytes([services.RequestDownload.SERVICE_ID, 0x12, 0x34, 0x56, 0xAB, 0xCD, 0xEF]) + method_bytes
+    )
+
+
+@pytest.mark.parametrize('kwargs, exception', [
+    ({'memory_address': 0x1000000, 'memory_size': 1}, OverflowError),
+    ({'memory_address': 0, 'memory_size': -1}, OverflowError),
+    ({'memory_address': 0, 'memory_size': 1, 'compression_method': 0x100}, ValueError),
+    ({'memory_address': 0, 'memory_size': 1, 'compression_method': 1, 'encryption_method': -1}, ValueError),
+])
+def test_transfer_request_out_of_range(kwargs, exception):
+    """Out-of-range transfer request fields raise instead of being truncated."""
+    with pytest.raises(exception):
+        services.RequestUpload.make_request(**kwargs)
+
+def test_request_reset_reuses_object():
+    """Request.reset rebinds service ID and data on the same object."""
+    request = services.TesterPresent.make_request(
+        response_required=services.TesterPresent.ResponseRequired.YES
+    )
+    
+    reused = request.reset(SERVICE_READ_DATA_BY_COMMON_IDENTIFIER, bytearray([0x12, 0x34]))
+    
+    assert reused is request
+    assert request.get_data() == bytes([SERVICE_READ_DATA_BY_COMMON_IDENTIFIER, 0x12, 0x34])
+    # Data is copied, so later changes to the caller's buffer don't leak in
+    assert isinstance(request.data, bytes)
+    
+    request.reset(SERVICE_READ_DATA_BY_COMMON_IDENTIFIER)
+    assert request.get_data() == bytes([SERVICE_READ_DATA_BY_COMMON_IDENTIFIER])
+
+
+def test_transfer_data_make_request_batch():
+    """A payload is split into blocks with a wrapping sequence number."""
+    payload = bytes(range(10))
+    
+    requests = list(services.TransferData.make_request_batch(
+        first_block_sequence_number=0xFE,
+        payload=payload,
+        block_size=4
+    ))
+    
+    assert [request.get_data() for request in requests] == [
+        bytes([services.TransferData.SERVICE_ID, 0xFE]) + payload[0:4],
+        bytes([services.TransferData.SERVICE_ID, 0xFF]) + payload[4:8],
+        bytes([services.TransferData.SERVICE_ID, 0x00]) + payload[8:10],
+    ]
+    # Each block matches the single-request builder
+    assert requests[1].get_data() == services.TransferData.make_request(0xFF, payload[4:8]).get_data()
+
+
+def test_transfer_data_make_request_batch_empty_payload():
+    """An empty payload yields no requests."""
+    assert list(services.TransferData.make_request_batch(1, b'', 4)) == []
+
+
+@pytest.mark.parametrize('first_block_sequence_number, block_size', [(0x100, 4), (-1, 4), (1, 0)])
+def test_transfer_data_make_request_batch_invalid(first_block_sequence_number, block_size):
+    """Invalid sequence numbers and block sizes are rejected by the call itself, not on first iteration."""
+    with pytest.raises(ValueError):
+        services.TransferData.make_request_batch(first_block_sequence_number, b'\x00', block_size)
@@ -0,0 +1,64 @@
+"""
+Pytest tests for KWP2000-STAR receive framing over serial port.
+Tests resynchronisation to the STAR start byte after line noise.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure project root is at the beginning of sys.path (highest priority)
+project_root_str = str(Path(__file__).parent.parent.parent.parent.resolve())
+if project_root_str in sys.path:
+    sys.path.remove(project_root_str)
+sys.path.insert(0, project_root_str)
+
+# Import from project root packages
+from kwp2000_can.protocols.kwp2000 import TransportException
+from kwp2000_can.protocols.serial.kwp2000_star_serial.transport import KWP2000StarTransport
+from kwp2000_can.protocols.serial.kwp2000_star_serial.frames import build_frame
+from tests.serial.mockup_comport import MockupComport
+
+
+def _make_transport(rx_bytes: bytes):
+    """Create an open STAR transport reading from a mock COM port."""
+    transport = KWP2000StarTransport(port='COM1')
+    mock_comport = MockupComport(rx_bytes)
+    transport._comport_transport = mock_comport
+    transport.open()
+    return transport, mock_comport
+
+
+def test_aligned_frame_uses_two_reads():
+    """A clean frame is received with one header read and one payload read."""
+    transport, mock_comport = _make_transport(build_frame(b'\x50\x89'))
+    
+    assert transport.wait_frame() == b'\x50\x89'
+    assert mock_comport.read_calls == 2
+
+
+@pytest.mark.parametrize('garbage', [
+    b'\x00',                      # start byte lands inside the first header read
+    b'\xff\x12\x00',
+    bytes(9),                     # more garbage than one header read
+])
+def test_resync_skips_garbage_before_start_byte(garbage):
+    """Bytes in front of the start byte are discarded instead of failing the frame."""
+    transport, mock_comport = _make_transport(garbage + build_frame(b'\x50\x89'))
+    
+    assert transport.wait_frame() == b'\x50\x89'
+
+
+def test_resync_gives_up_after_max_skip():
+    """A line with no start byte at all is reported instead of read forever."""
+    transport, mock_comport = _make_transport(bytes(300))
+    
+    with pytest.raises(TransportException):
+        transport.wait_frame()
+
+
+def test_resync_timeout_returns_none():
+    """Garbage followed by silence is treated as a timeout."""
+    transport, mock_comport = _make_transport(bytes(6))
+    
+    assert transport.wait_frame() is None
@@ -0,0 +1,98 @@
+from typing import List, Optional
+
+from kwp2000_can.protocols.kwp2000 import Transport, TransportException
+
+
+class MockupComport(Transport):
+    """
+    Mock COM port that serves a queued byte stream and records sent data.
+    
+    Mirrors ComportTransport: wait_frame returns up to max_bytes queued bytes
+    (None when nothing is queued, i.e. a timeout), and wait_frame_into copies
+    up to len(buffer) queued bytes into a caller-owned buffer (0 on timeout).
+    Use it in place of a protocol transport's _comport_transport.
+    """
+    
+    def __init__(self, rx_bytes: bytes = b''):
+        """
+        Initialize MockupComport.
+        
+        Args:
+            rx_bytes: Bytes to be received, in order
+        """
+        self._rx_bytes = bytearray(rx_bytes)
+        self._sent_frames: List[bytes] = []
+        self._is_open = False
+        self.read_calls = 0
+    
+    def open(self) -> None:
+        """Open the mock COM port."""
+        self._is_open = True
+    
+    def close(self) -> None:
+        """Close the mock COM port."""
+        self._is_open = False
+    
+    def send(self, data: bytes) -> None:
+        """
+        Record a copy of the sent data (data may be a view of a reused buffer).
+        
+        Raises:
+            TransportException: If the port is not open
+        """
+        if not self._is_open:
+            raise TransportException("Transport not open")
+        self._sent_frames.append(bytes(data))
+    
+    def wait_frame(self, timeout: float = 1.0, max_bytes: int = 1024) -> Optional[bytes]:
+        """
+        Return up to max_bytes queued bytes.
+        
+        Args:
+            timeout: Ignored, the queued bytes are available immediately
+            max_bytes: Maximum number of bytes to return
+            
+        Returns:
+            Received bytes, or None if nothing is queued
+            
+        Raises:
+            TransportException: If the port is not open
+        """
+        if not self._is_open:
+            raise TransportException("Transport not open")
+        self.read_calls += 1
+        if not self._rx_bytes:
+            return None
+        data = bytes(self._rx_bytes[:max_bytes])
+        del self._rx_bytes[:max_bytes]
+        return data
+    
+    def wait_frame_into(self, buffer, timeout: float = 1.0) -> int:
+        """
+        Copy up to len(buffer) queued bytes into buffer.
+        
+        Args:
+            buffer: Writable bytes-like object to receive the data
+            timeout: Ignored, the queued bytes are available immediately
+            
+        Returns:
+            Number of bytes copied, 0 if nothing is queued
+            
+        Raises:
+            TransportException: If the port is not open
+        """
+        if not self._is_open:
+            raise TransportException("Transport not open")
+        self.read_calls += 1
+        count = min(len(buffer), len(self._rx_bytes))
+        buffer[:count] = self._rx_bytes[:count]
+        del self._rx_bytes[:count]
+        return count
+    
+    def queue_bytes(self, data: bytes) -> None:
+        """Queue raw bytes to be received."""
+        self._rx_bytes += data
+    
+    def get_sent_frames(self) -> List[bytes]:
+        """Get all data that was sent, one entry per send call."""
+        return self._sent_frames.copy()